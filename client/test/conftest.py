@@ -0,0 +1,593 @@
+# Lives in the rootdir rather than in src/ so pytest always loads it before
+# parsing the command line: with "--browser-mode headless" the value would
+# otherwise be taken for a test path and none of these options would exist.
+import pytest
+import allure
+import json
+import os
+import platform
+import time
+import warnings
+from contextlib import nullcontext
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from datetime import datetime
+
+from src.locator_registry import load_locators, find_missing_references, LocatorRegistryError
+from src.parallel import (
+    worker_dir, is_worker, merge_worker_dirs, get_worker_id, worker_file, merge_worker_files, MAIN_WORKER
+)
+from src.browser_pool import BrowserPool
+from src.driver_resolver import resolve_driver, DriverResolutionError
+from src.browser_options import build_chrome_options, parse_window_size, set_viewport
+from src.util import open_authenticated_page, install_disclaimer_bypass, remove_disclaimer_bypass
+from src.cleanup import CleanupRegistry
+from src.local_server import LocalServer
+from src.config import CONFIG, url
+from src import timings
+from src.page_metrics import instrument_page_metrics, write_page_metrics, PAGE_METRICS_FILE, LCP_WAIT_MS
+from src import perf_budget
+from src.network_control import NetworkControl, DEFAULT_BLOCKLIST
+from src.artifacts import (
+    ArtifactWriter, reserve_allure_attachment, ALLURE_ATTACHMENT_GLOB, SCREENSHOT_EXTENSION, SCREENSHOT_MIME
+)
+from src import start_state
+from src import durations
+
+SCREENSHOTS_DIR = "screenshots"
+
+# seconds spent resetting pooled browsers, collected from every teardown report
+RESET_TIMES = []
+
+# performance budget checks of every test, collected from every teardown report
+BUDGET_RESULTS = []
+
+# True/False for every test with a start state: was the page already there
+START_STATE_REUSES = []
+
+# nodeid -> outcome, seconds (setup + call + teardown) and worker, stored in the durations db
+TEST_RESULTS = {}
+
+# compresses and stores failure screenshots / page sources in the background, waited for at session end
+ARTIFACT_WRITER = None
+
+# nodeid of the running test, used to tag page metrics
+CURRENT_TEST = None
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-pool-size", type=int, default=1,
+        help="Number of warm browsers started up front for the pooled_driver fixture"
+    )
+    parser.addoption(
+        "--driver-source", choices=["local", "manager", "auto"], default="local",
+        help="Where chromedriver comes from: pinned local cache (no network), "
+             "webdriver_manager, or local with webdriver_manager fallback"
+    )
+    parser.addoption(
+        "--browser-mode", choices=["headed", "headless"], default="headed",
+        help="headless runs Chrome with --headless=new and CI performance switches"
+    )
+    parser.addoption(
+        "--window-size", default="1920,1080",
+        help="Fixed page viewport as WIDTH,HEIGHT, emulated the same in both modes so screenshots match"
+    )
+    parser.addoption(
+        "--disable-images", action="store_true", default=False,
+        help="Do not load images"
+    )
+    parser.addoption(
+        "--no-block-third-party", action="store_true", default=False,
+        help="Let the browser load third-party images, fonts and analytics (blocked by default, "
+             "also while page metrics and budgets are measured)"
+    )
+    parser.addoption(
+        "--no-disclaimer-bypass", action="store_true", default=False,
+        help="Click the landing disclaimer away through the UI in every test instead of dismissing it in-page"
+    )
+    parser.addoption(
+        "--page-metrics", choices=["budgets", "all", "off"], default="budgets",
+        help="Read Navigation Timing / LCP / CLS after a driver.get only of pages with a page load budget, "
+             "after every driver.get (waiting for LCP only where it has a budget), or never"
+    )
+    parser.addoption(
+        "--perf-budgets", choices=["fail", "warn", "off"], default="warn",
+        help="Performance budgets from pages/<page>/budgets.py: only warn when a budget is exceeded, "
+             "fail the test (unless the budget is marked as warn), or don't check them"
+    )
+    parser.addoption(
+        "--artifacts-max-files", type=int, default=200,
+        help="Failure screenshots/page sources kept per process, the oldest are deleted first"
+    )
+    parser.addoption(
+        "--artifacts-max-mb", type=float, default=200,
+        help="Disk space the failure artifacts of a process may use, the oldest are deleted first"
+    )
+    parser.addoption(
+        "--no-start-state-schedule", action="store_true", default=False,
+        help="Keep the collected test order instead of grouping tests by their start_state marker"
+    )
+    parser.addoption(
+        "--shard", default=None,
+        help="Run only shard i of N (1-based, e.g. 2/4), split by the test durations of past runs"
+    )
+    parser.addoption(
+        "--durations-db", default=durations.DURATIONS_DB,
+        help="SQLite file holding per-test durations, outcomes and environment of past runs"
+    )
+    parser.addoption(
+        "--no-record-durations", action="store_true", default=False,
+        help="Don't add this run to the durations db"
+    )
+    parser.addoption(
+        "--base-url", default=None,
+        help="Site under test (default: NOT_ALONE_BASE_URL or https://notalonesoldier.com)"
+    )
+    parser.addoption(
+        "--local-server", action="store_true", default=False,
+        help="Serve Server/public and a mock /api from localhost instead of using the live site"
+    )
+    parser.addoption(
+        "--mock-latency-ms", type=float, default=0,
+        help="Delay added to every mock /api response of the local server"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Every xdist worker gets its own screenshots/ and allure-results/ sub-folder.
+    # Runs before allure's own pytest_configure so its file logger picks up the worker dir.
+    config.addinivalue_line(
+        "markers",
+        "start_state(path, role=None, dialog=None): page (logged in as role, with dialog open) "
+        "the test starts on, reused from the previous test when the browser is still there"
+    )
+    config.shard = None
+    if config.getoption("--shard"):
+        try:
+            config.shard = durations.parse_shard(config.getoption("--shard"))
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+    try:
+        config.window_size = parse_window_size(config.getoption("--window-size"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    config.screenshots_dir = worker_dir(SCREENSHOTS_DIR, config)
+    global ARTIFACT_WRITER
+    ARTIFACT_WRITER = ArtifactWriter(
+        config.screenshots_dir,
+        max_files=config.getoption("--artifacts-max-files"),
+        max_bytes=int(config.getoption("--artifacts-max-mb") * 1024 * 1024)
+    )
+    alluredir = getattr(config.option, "allure_report_dir", None)
+    if alluredir and is_worker(config):
+        config.option.allure_report_dir = worker_dir(alluredir, config)
+    if config.getoption("--base-url"):
+        CONFIG.base_url = config.getoption("--base-url")
+    # timings.jsonl is rewritten every run, xdist workers write their own file that is merged at the end
+    config.timings_file = worker_file(timings.TIMINGS_FILE, config)
+    config.page_metrics_file = worker_file(PAGE_METRICS_FILE, config)
+    # one id for the whole run, handed to xdist workers in pytest_configure_node
+    config.run_id = config.workerinput["run_id"] if is_worker(config) else datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["run_id"] = node.config.run_id
+
+
+def pytest_runtest_logstart(nodeid):
+    global CURRENT_TEST
+    CURRENT_TEST = nodeid
+
+
+def pytest_sessionstart(session):
+    # stored with the run in the durations db
+    session.config.started = time.time()
+    # Build the (page, name) -> xpath registry once instead of on every lookup
+    try:
+        load_locators()
+    except LocatorRegistryError as e:
+        raise pytest.UsageError(f"Invalid locators:\n{e}")
+    try:
+        perf_budget.load_budgets()
+    except perf_budget.PerfBudgetError as e:
+        raise pytest.UsageError(f"Invalid performance budgets:\n{e}")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    # Keep only this machine's share of the suite, balanced on past durations
+    if config.shard:
+        index, count = config.shard
+        shards = durations.split_into_shards(
+            [item.nodeid for item in items], durations.load_durations(config.getoption("--durations-db")), count
+        )
+        selected = set(shards[index - 1])
+        config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in selected])
+        items[:] = [item for item in items if item.nodeid in selected]
+    # Tests starting from the same page run back to back so they can reuse it
+    if not config.getoption("--no-start-state-schedule"):
+        items[:] = start_state.schedule(items)
+
+
+def pytest_collection_finish(session):
+    # Fail before any browser starts if a test uses a locator that doesn't exist
+    paths = sorted({str(item.fspath) for item in session.items})
+    missing = find_missing_references(paths)
+    if missing:
+        raise pytest.UsageError("Unknown locators referenced:\n" + "\n".join(missing))
+
+
+def pytest_sessionfinish(session):
+    for error in ARTIFACT_WRITER.close():
+        print(f"Failed to store failure artifacts: {error}")
+    # The controller merges the per-worker folders once every worker is done
+    if is_worker(session.config):
+        return
+    # each worker only pruned its own folder, the limits apply to the merged one
+    if merge_worker_dirs(SCREENSHOTS_DIR):
+        ARTIFACT_WRITER.prune_merged(SCREENSHOTS_DIR)
+    merge_worker_files(timings.TIMINGS_FILE)
+    merge_worker_files(PAGE_METRICS_FILE)
+    if TEST_RESULTS and not session.config.getoption("--no-record-durations"):
+        record_durations(session.config)
+    alluredir = getattr(session.config.option, "allure_report_dir", None)
+    if alluredir:
+        merge_worker_dirs(alluredir)
+        ARTIFACT_WRITER.prune_merged(alluredir, ALLURE_ATTACHMENT_GLOB)
+
+
+def record_durations(config):
+    shard = config.getoption("--shard")
+    durations.record_run({
+        "run_id": f"{config.run_id}-shard{shard.replace('/', 'of')}" if shard else config.run_id,
+        "started": config.started,
+        "base_url": CONFIG.base_url,
+        "browser": config.getoption("--browser-mode"),
+        "shard": shard,
+        "workers": getattr(config.option, "numprocesses", None) or 1,
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+    }, [{"test": test, **result} for test, result in TEST_RESULTS.items()], config.getoption("--durations-db"))
+
+
+def get_driver_path(config):
+    # Resolved once per process, every browser launch after that reuses the path
+    if getattr(config, "chromedriver_path", None) is None:
+        try:
+            config.chromedriver_path, seconds = resolve_driver(config.getoption("--driver-source"))
+        except DriverResolutionError as e:
+            pytest.exit(str(e), returncode=pytest.ExitCode.USAGE_ERROR)
+        print(f"chromedriver resolved in {seconds * 1000:.0f} ms: {config.chromedriver_path}")
+        allure.attach(
+            f"{config.chromedriver_path}\n{seconds * 1000:.0f} ms",
+            name="chromedriver resolution",
+            attachment_type=allure.attachment_type.TEXT
+        )
+    return config.chromedriver_path
+
+
+def create_driver(config):
+    options = build_chrome_options(
+        mode=config.getoption("--browser-mode"),
+        disable_images=config.getoption("--disable-images")
+    )
+
+    driver = webdriver.Chrome(service=ChromeService(get_driver_path(config)), options=options)
+    # Same fixed viewport headed or headless for consistent screenshots
+    set_viewport(driver, *config.window_size)
+    # page loads never wait on third parties, tests add their own blocks and stubs through the network fixture
+    driver.network = NetworkControl(driver, [] if config.getoption("--no-block-third-party") else DEFAULT_BLOCKLIST)
+    if not config.getoption("--no-disclaimer-bypass"):
+        install_disclaimer_bypass(driver)
+    if config.getoption("--page-metrics") != "off":
+        instrument_page_metrics(
+            driver,
+            lambda page_url, metrics: on_page_metrics(config, page_url, metrics),
+            lambda page_url: page_metrics_wait(config, page_url)
+        )
+    return timings.instrument_driver(driver)
+
+
+def page_metrics_wait(config, page_url):
+    # LCP wait after visiting page_url, None skips its metrics: only pages with a load budget
+    # pay for reading them unless --page-metrics all, and only an LCP budget waits for the paint
+    budgets = [] if config.getoption("--perf-budgets") == "off" else perf_budget.page_budgets(page_url)
+    if any(budget["metric"] == "largestContentfulPaint" for budget in budgets):
+        return LCP_WAIT_MS
+    if budgets or config.getoption("--page-metrics") == "all":
+        return 0
+    return None
+
+
+def on_page_metrics(config, page_url, metrics):
+    write_page_metrics(config.page_metrics_file, config.run_id, CURRENT_TEST, page_url, metrics,
+                       third_party_blocked=not config.getoption("--no-block-third-party"))
+    allure.attach(
+        json.dumps(metrics, indent=2),
+        name=f"Page metrics {page_url}",
+        attachment_type=allure.attachment_type.JSON
+    )
+    # page load budgets of this path, only recorded here: exceeded 'fail' budgets fail the test
+    # once its call is over (pytest_runtest_makereport), not the fixture or step that navigated
+    mode = config.getoption("--perf-budgets")
+    if mode == "off":
+        return
+    for budget in perf_budget.page_budgets(page_url):
+        value = metrics.get(budget["metric"])
+        if value is not None:
+            perf_budget.check(budget, value, mode)
+
+
+# this is the setup for all tests
+@pytest.fixture(scope="session")
+def driver(request):
+    driver = create_driver(request.config)
+
+    yield driver  # Provide the WebDriver instance to tests
+
+    driver.quit()  # Close the browser after tests finish
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    pool = BrowserPool(lambda: create_driver(request.config), size=request.config.getoption("--browser-pool-size"))
+    yield pool
+    pool.close()
+
+
+# isolated browser per test: taken warm from the pool and reset when the test ends
+@pytest.fixture
+def pooled_driver(browser_pool, request):
+    driver = browser_pool.acquire()
+
+    yield driver
+
+    duration = browser_pool.release(driver)
+    request.node.user_properties.append(("browser_reset_seconds", duration))
+    allure.attach(
+        f"{duration * 1000:.1f} ms",
+        name="Browser reset time",
+        attachment_type=allure.attachment_type.TEXT
+    )
+
+
+# times every util helper and WebDriver command of the test, attaches the breakdown
+# to allure and appends one line per test to timings.jsonl
+@pytest.fixture(autouse=True)
+def _step_timings(request):
+    timings.start_recording()
+    start = time.perf_counter()
+
+    yield
+
+    duration = time.perf_counter() - start
+    steps = timings.stop_recording()
+    summary = timings.summarize(steps)
+    allure.attach(
+        timings.format_summary(summary),
+        name="Step timings",
+        attachment_type=allure.attachment_type.TEXT
+    )
+    timings.write_timings(request.config.timings_file, {
+        "test": request.node.nodeid,
+        "worker": get_worker_id(request.config),
+        "seconds": duration,
+        "summary": summary,
+        "steps": steps,
+    })
+
+
+# per-test URL blocks and canned API responses on the test's browser, undone when the test ends
+# usage: network.block("*github.com*"); network.stub("POST", r"/api/donations$", {"_id": "1"}, status=201)
+def get_test_browser(request):
+    # the browser the test runs in: its isolated pooled_driver if it uses one, the session driver otherwise
+    return request.getfixturevalue("pooled_driver" if "pooled_driver" in request.fixturenames else "driver")
+
+
+@pytest.fixture
+def network(request):
+    browser = get_test_browser(request)
+
+    yield browser.network
+
+    browser.network.reset()
+
+
+# the landing disclaimer shows up as for a real visitor, for the test of the disclaimer itself
+@pytest.fixture
+def show_disclaimer(request):
+    browser = get_test_browser(request)
+    bypassed = bool(getattr(browser, "disclaimer_bypass", None))
+    remove_disclaimer_bypass(browser)
+
+    yield browser
+
+    if bypassed:
+        install_disclaimer_bypass(browser)
+
+
+# interaction budgets from pages/<page>/budgets.py, timed around the enclosed block
+# usage: with budget("landing", "donate_dialog_open"): ...
+@pytest.fixture
+def budget(request):
+    mode = request.config.getoption("--perf-budgets")
+
+    def _measure(page, name):
+        # an unknown name raises even with --perf-budgets off
+        entry = perf_budget.get_budget(page, name)
+        return nullcontext() if mode == "off" else perf_budget.measure(entry, mode)
+    return _measure
+
+
+# collects the budget checks of the test for allure and the end-of-run report
+@pytest.fixture(autouse=True)
+def _perf_budgets(request):
+    perf_budget.start_recording()
+
+    yield
+
+    results = perf_budget.stop_recording()
+    if not results:
+        return
+    allure.attach(
+        perf_budget.format_report(results),
+        name="Performance budgets",
+        attachment_type=allure.attachment_type.TEXT
+    )
+    request.node.user_properties.extend(("perf_budget", result) for result in results)
+    exceeded = [result for result in results if not result["passed"] and result["severity"] == "warn"]
+    if exceeded:
+        warnings.warn(pytest.PytestWarning(
+            "Performance budgets exceeded:\n" + perf_budget.format_report(exceeded)
+        ))
+
+
+# brings the test's browser to its start_state marker, navigating only when the page changed
+@pytest.fixture(autouse=True)
+def _start_state(request):
+    state = start_state.get_start_state(request.node)
+    if state is not None:
+        reused = start_state.open_start_state(get_test_browser(request), state)
+        request.node.user_properties.append(("start_state_reused", reused))
+
+
+# built SPA + mock API on a free localhost port, e.g. local_server.latency_ms = 1500 for a slow backend
+@pytest.fixture(scope="session")
+def local_server(request):
+    server = LocalServer(latency_ms=request.config.getoption("--mock-latency-ms")).start()
+    yield server
+    server.stop()
+
+
+# with --local-server every page and API call of the run goes to the local stand-in
+@pytest.fixture(scope="session", autouse=True)
+def _use_local_server(request):
+    if not request.config.getoption("--local-server"):
+        yield
+        return
+    base_url = CONFIG.base_url
+    CONFIG.base_url = request.getfixturevalue("local_server").base_url
+    yield
+    CONFIG.base_url = base_url
+
+
+# opens a page already logged in (API login cached per role + sessionStorage injection)
+# usage: login_as("soldier", "/profile")
+@pytest.fixture
+def login_as(driver):
+    def _login_as(role, path):
+        open_authenticated_page(driver, role, url(path))
+        return driver
+    return _login_as
+
+
+# ids of resources created by tests, deleted together when the session ends
+# usage: cleanup.add("users", user_id)
+@pytest.fixture(scope="session")
+def cleanup():
+    registry = CleanupRegistry()
+
+    yield registry
+
+    count = len(registry.resources)
+    failures = registry.run()
+    print(f"cleanup: {count - len(failures)}/{count} test resources deleted")
+    if failures:
+        warnings.warn(pytest.PytestWarning(
+            "Some test resources could not be cleaned up:\n" + "\n".join(failures)
+        ))
+
+
+def pytest_runtest_logreport(report):
+    # with xdist the controller gets every worker's reports, so the durations db sees the whole run
+    result = TEST_RESULTS.setdefault(report.nodeid, {
+        "outcome": "passed", "seconds": 0.0, "worker": getattr(report, "worker_id", MAIN_WORKER)
+    })
+    result["seconds"] += report.duration
+    if report.failed and result["outcome"] != "failed":
+        result["outcome"] = "failed" if report.when == "call" else "error"
+    elif report.skipped and result["outcome"] == "passed":
+        result["outcome"] = "skipped"
+    # user_properties travel back from xdist workers, so this sees every worker's resets
+    if report.when == "teardown":
+        RESET_TIMES.extend(value for name, value in report.user_properties if name == "browser_reset_seconds")
+        START_STATE_REUSES.extend(value for name, value in report.user_properties if name == "start_state_reused")
+        BUDGET_RESULTS.extend(value for name, value in report.user_properties if name == "perf_budget")
+
+
+def pytest_terminal_summary(terminalreporter):
+    if RESET_TIMES:
+        terminalreporter.write_line(
+            f"browser resets: {len(RESET_TIMES)}, avg {sum(RESET_TIMES) / len(RESET_TIMES) * 1000:.0f} ms, "
+            f"max {max(RESET_TIMES) * 1000:.0f} ms, total {sum(RESET_TIMES):.2f} s"
+        )
+    if START_STATE_REUSES:
+        terminalreporter.write_line(
+            f"start states: {sum(START_STATE_REUSES)}/{len(START_STATE_REUSES)} reused the page without navigating"
+        )
+    if BUDGET_RESULTS:
+        exceeded = sum(not result["passed"] for result in BUDGET_RESULTS)
+        terminalreporter.write_sep("-", f"performance budgets: {exceeded}/{len(BUDGET_RESULTS)} checks exceeded")
+        terminalreporter.write_line(perf_budget.format_report(BUDGET_RESULTS))
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Exceeded 'fail' budgets recorded during setup and call turn a passed call into a failure
+    if call.when == "call" and call.excinfo is None:
+        exceeded = perf_budget.failed(perf_budget.recorded())
+        if exceeded:
+            try:
+                raise perf_budget.BudgetExceeded(
+                    "❌ Performance budgets exceeded:\n" + perf_budget.format_report(exceeded)
+                )
+            except perf_budget.BudgetExceeded:
+                call.excinfo = pytest.ExceptionInfo.from_current()
+    outcome = yield
+    report = outcome.get_result()
+
+    if report.when == "call":
+        # If a test has failed
+        if report.failed:
+            try:
+                # Get the driver fixture
+                driver = item.funcargs.get('driver') or item.funcargs['pooled_driver']
+
+                # Create a unique filename for the screenshot
+                timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+                test_name = item.name.replace(" ", "_").replace("/", "_")
+                screenshot_path = os.path.abspath(
+                    os.path.join(item.config.screenshots_dir, f"failed_{test_name}_{timestamp}.{SCREENSHOT_EXTENSION}")
+                )
+
+                # Only grab the screenshot and page source here and reserve their allure attachments,
+                # encoding, compressing and writing happen on the artifact writer thread
+                allure_files = {
+                    name: reserve_allure_attachment(item.config, f"{name} of failure in {test_name}", extension, mime)
+                    for name, extension, mime in [("Screenshot", SCREENSHOT_EXTENSION, SCREENSHOT_MIME),
+                                                  ("Page source", "html", "text/html")]
+                }
+                ARTIFACT_WRITER.submit(
+                    f"failed_{test_name}_{timestamp}",
+                    driver.get_screenshot_as_png(), driver.page_source,
+                    {name: file_name for name, file_name in allure_files.items() if file_name}
+                )
+
+                # Add to the HTML report if using pytest-html
+                if hasattr(item.config, '_html'):
+                    # Create relative path for HTML report
+                    rel_path = os.path.relpath(screenshot_path, os.path.dirname(item.config.option.htmlpath))
+                    report.extra = [
+                        {'name': 'Screenshot', 'format': 'image', 'content': rel_path}
+                    ]
+
+            except Exception as e:
+                print(f"Failed to capture screenshot: {str(e)}")
+                allure.attach(
+                    str(e),
+                    name="Screenshot capture failed",
+                    attachment_type=allure.attachment_type.TEXT
+                )
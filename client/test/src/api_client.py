@@ -0,0 +1,94 @@
+import base64
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import CONFIG
+
+# Overrides the API location, by default it is <base url>/api
+API_BASE_URL = os.environ.get("NOT_ALONE_API_URL")
+
+# Accounts used by the tests, one per user type. Only admin and soldier exist on the
+# live site, the others are created on local servers by server_process.seed_users().
+TEST_USERS = {
+    "admin": {"email": "shalev396@admin.com", "password": "12345678a"},
+    "soldier": {"email": "nathan@soldier.com", "password": "12345678"},
+    "municipality": {"email": "municipality@not-alone.test", "password": "12345678a"},
+    "donor": {"email": "donor@not-alone.test", "password": "12345678a"},
+    "organization": {"email": "organization@not-alone.test", "password": "12345678a"},
+    "business": {"email": "business@not-alone.test", "password": "12345678a"},
+}
+
+# role -> the server's user type
+USER_TYPES = {role: role.capitalize() for role in TEST_USERS}
+
+# Re-login this many seconds before the JWT actually expires
+TOKEN_EXPIRY_MARGIN = 30
+
+
+def build_session(pool_size: int = 10, retries: int = 3) -> requests.Session:
+    session = requests.Session()
+    # Idempotent requests (GET, DELETE, ...) are retried on gateway errors with backoff
+    retry = Retry(total=retries, backoff_factor=0.3, status_forcelist=[502, 503, 504]) if retries else 0
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One keep-alive connection pool shared by every API call in the process
+SESSION = build_session()
+
+# role -> login response ({"token": ..., "user": {...}}) and the token's expiry time
+_TOKEN_CACHE: Dict[str, dict] = {}
+_TOKEN_LOCK = threading.Lock()
+
+
+def api_url(path: str) -> str:
+    return f"{(API_BASE_URL or CONFIG.api_url).rstrip('/')}/{path.lstrip('/')}"
+
+
+def get_token_expiry(token: str) -> Optional[float]:
+    """Returns the 'exp' claim of a JWT as a unix timestamp, or None."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError):
+        return None
+
+
+def api_login(role: str) -> dict:
+    """
+    Logs in through /auth/login and caches the response per role until the
+    JWT is about to expire, so the login rate limiter is hit once per run
+    instead of once per test.
+
+    :param role: Key in TEST_USERS (e.g. 'admin', 'soldier').
+    :return:     The login response JSON: {"token": "...", "user": {...}}.
+    """
+    with _TOKEN_LOCK:
+        cached = _TOKEN_CACHE.get(role)
+        if cached and (cached["expires"] is None or cached["expires"] - TOKEN_EXPIRY_MARGIN > time.time()):
+            return cached["data"]
+
+        response = SESSION.post(api_url("/auth/login"), json=TEST_USERS[role])
+        # Raise an exception if the request returned an error status
+        response.raise_for_status()
+        data = response.json()
+        _TOKEN_CACHE[role] = {"data": data, "expires": get_token_expiry(data["token"])}
+        return data
+
+
+def get_token(role: str) -> str:
+    return api_login(role)["token"]
+
+
+def auth_headers(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,294 @@
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import aiohttp
+
+from src.api_client import SESSION, TEST_USERS, api_url, auth_headers, get_token
+from src.server_process import LOAD_CITY, add_server_arguments, ensure_channels, ensure_city, target_server
+
+# Channel the messages scenario reads, found by name so repeated runs reuse it
+LOAD_CHANNEL = "load-test-channel"
+SEED_MESSAGES = 50
+
+# Query parameters the posts scenario picks from
+POSTS_PAGES = range(1, 6)
+POSTS_LIMITS = (10, 20, 50)
+
+# A scenario starting this much after its scheduled time means the generator fell behind
+LATE_START_MS = 50
+
+PERCENTILES = (50, 95, 99)
+
+
+class Sample(NamedTuple):
+    name: str
+    seconds: float
+    status: Optional[int]
+    error: Optional[str]
+
+
+class LoadClient:
+    """
+    What every scenario gets: one aiohttp session keeping at most
+    `concurrency` keep-alive connections, without retries (a retried call
+    would hide the error and double the latency), the tokens and fixture
+    ids, and the list the timed calls are recorded in. Use it with
+    `async with` inside the running event loop.
+    """
+
+    def __init__(self, fixtures: dict, concurrency: int, timeout: float = 10):
+        self.fixtures = fixtures
+        self.concurrency = concurrency
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.samples: List[Sample] = []
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "LoadClient":
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.concurrency), timeout=self.timeout
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+
+    async def call(self, name: str, method: str, path: str, role: Optional[str] = None,
+                   since: Optional[float] = None, **kwargs) -> Optional[dict]:
+        """
+        Sends one API call and records its latency under `name`.
+
+        :param since: Event loop time the latency is measured from, the
+                      scheduled start for a scenario's first call, so time
+                      spent waiting for the loop or a free connection counts
+                      (no coordinated omission). Defaults to now.
+        :return:      The response JSON, or None when it failed (status >= 400 or no answer).
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time() if since is None else since
+        headers = auth_headers(self.fixtures["tokens"][role]) if role else {}
+        body = None
+        try:
+            async with self.session.request(method, api_url(path), headers=headers, **kwargs) as response:
+                status = response.status
+                error = f"HTTP {status}" if status >= 400 else None
+                if error is None:
+                    body = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            status, error = None, type(e).__name__
+        self.samples.append(Sample(name, loop.time() - start, status, error))
+        return body if error is None else None
+
+
+async def scenario_login(client: LoadClient, rng: random.Random, due: float):
+    await client.call("POST /auth/login", "POST", "/auth/login", json=TEST_USERS["soldier"], since=due)
+
+
+async def scenario_posts(client: LoadClient, rng: random.Random, due: float):
+    params = {"page": rng.choice(POSTS_PAGES), "limit": rng.choice(POSTS_LIMITS)}
+    await client.call("GET /posts", "GET", "/posts", role="soldier", params=params, since=due)
+
+
+async def scenario_channel_messages(client: LoadClient, rng: random.Random, due: float):
+    await client.call("GET /messages/channel/:id", "GET", f"/messages/channel/{client.fixtures['channel_id']}",
+                      role="soldier", params={"page": 1, "limit": 50}, since=due)
+
+
+async def scenario_create_delete_request(client: LoadClient, rng: random.Random, due: float):
+    body = {
+        "service": rng.choice(["Regular", "Reserves"]),
+        "item": "Load test item",
+        "itemDescription": "Created and deleted by the API load test",
+        "quantity": rng.randint(1, 5),
+        "zone": LOAD_CITY["zone"],
+        "city": client.fixtures["city_id"],
+        "agreeToShareDetails": True,
+    }
+    created = await client.call("POST /requests", "POST", "/requests", role="soldier", json=body, since=due)
+    if created is not None:
+        # only sent once the create has answered, timed from then
+        await client.call("DELETE /requests/:id", "DELETE", f"/requests/{created['_id']}", role="soldier")
+
+
+# name -> (scenario, default weight)
+SCENARIOS: Dict[str, tuple] = {
+    "login": (scenario_login, 1),
+    "posts": (scenario_posts, 4),
+    "channel_messages": (scenario_channel_messages, 3),
+    "create_delete_request": (scenario_create_delete_request, 1),
+}
+
+
+def prepare_fixtures(user_ids: Dict[str, str]) -> dict:
+    """
+    Logs in the admin and soldier once and makes sure the city the requests
+    are created in and the soldier's channel (with some messages) exist.
+    """
+    tokens = {role: get_token(role) for role in ("admin", "soldier")}
+    city_id = ensure_city()
+    channel_ids = ensure_channels([LOAD_CHANNEL], member_ids=[user_ids["admin"]])
+    channel_id = channel_ids[LOAD_CHANNEL]
+
+    messages = SESSION.get(api_url(f"/messages/channel/{channel_id}"), headers=auth_headers(tokens["soldier"]))
+    messages.raise_for_status()
+    if not messages.json().get("messages"):
+        for index in range(SEED_MESSAGES):
+            SESSION.post(api_url("/messages"), headers=auth_headers(tokens["soldier"]),
+                         json={"channelId": channel_id, "content": f"Load test message {index}"}
+                         ).raise_for_status()
+
+    return {"tokens": tokens, "city_id": city_id, "channel_id": channel_id}
+
+
+async def run_load(client: LoadClient, weights: Dict[str, float], rate: float, duration: float,
+                   seed: int = 0) -> dict:
+    """
+    Open-loop generator: starts a weighted random scenario every 1/rate
+    seconds for `duration` seconds, whether or not the previous ones have
+    finished, so a slow server shows up as latency instead of a lower rate.
+    Latencies count from the scheduled start, so a scenario that had to wait
+    for the loop or a connection is slower, not left out.
+
+    :return: {"elapsed": seconds, "started": scenarios, "late": scenarios that
+             started over LATE_START_MS after their scheduled time, "max_lag_ms"}.
+    """
+    loop = asyncio.get_running_loop()
+    rng = random.Random(seed)
+    names = list(weights)
+    lags: List[float] = []
+
+    async def run_scenario(scenario: Callable, scenario_rng: random.Random, due: float):
+        lags.append((loop.time() - due) * 1000)
+        await scenario(client, scenario_rng, due)
+
+    start = loop.time()
+    tasks = []
+    for index in range(int(rate * duration)):
+        due = start + index / rate
+        await asyncio.sleep(max(0.0, due - loop.time()))
+        name = rng.choices(names, [weights[name] for name in names])[0]
+        tasks.append(asyncio.create_task(
+            run_scenario(SCENARIOS[name][0], random.Random(rng.getrandbits(32)), due)
+        ))
+    await asyncio.gather(*tasks)
+    elapsed = loop.time() - start
+
+    return {
+        "elapsed": elapsed,
+        "started": len(tasks),
+        "late": sum(1 for lag in lags if lag > LATE_START_MS),
+        "max_lag_ms": max(lags, default=0.0),
+    }
+
+
+async def generate_load(fixtures: dict, weights: Dict[str, float], rate: float, duration: float,
+                        concurrency: int, seed: int = 0):
+    """run_load() with its own LoadClient, returns (client, run)."""
+    async with LoadClient(fixtures, concurrency) as client:
+        run = await run_load(client, weights, rate, duration, seed)
+    return client, run
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(1, math.ceil(pct / 100 * len(sorted_values))) - 1]
+
+
+def summarize(samples: List[Sample], elapsed: float) -> Dict[str, dict]:
+    """
+    Per call name (plus "total"): count, errors, error_rate, rps and the
+    p50/p95/p99 latency in ms, with the count of every error kind.
+    """
+    by_name: Dict[str, List[Sample]] = {}
+    for sample in samples:
+        by_name.setdefault(sample.name, []).append(sample)
+        by_name.setdefault("total", []).append(sample)
+
+    summary = {}
+    for name, group in by_name.items():
+        latencies = sorted(sample.seconds * 1000 for sample in group)
+        errors: Dict[str, int] = {}
+        for sample in group:
+            if sample.error:
+                errors[sample.error] = errors.get(sample.error, 0) + 1
+        summary[name] = {
+            "count": len(group),
+            "errors": sum(errors.values()),
+            "error_rate": sum(errors.values()) / len(group),
+            "rps": len(group) / elapsed if elapsed else 0.0,
+            **{f"p{pct}_ms": percentile(latencies, pct) for pct in PERCENTILES},
+            "error_kinds": errors,
+        }
+    return summary
+
+
+def format_summary(summary: Dict[str, dict], run: dict) -> str:
+    lines = [f"{'call':<28}{'count':>7}{'errors':>8}{'rps':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+    for name in sorted(summary, key=lambda name: (name == "total", name)):
+        row = summary[name]
+        lines.append(
+            f"{name:<28}{row['count']:>7}{row['error_rate']:>8.1%}{row['rps']:>8.1f}"
+            f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}"
+        )
+        for kind, count in sorted(row["error_kinds"].items()):
+            lines.append(f"    {kind}: {count}")
+    lines.append(
+        f"{run['started']} scenarios in {run['elapsed']:.1f}s, {run['late']} started over "
+        f"{LATE_START_MS} ms late (max {run['max_lag_ms']:.0f} ms)"
+    )
+    return "\n".join(lines)
+
+
+def parse_weights(values: List[str]) -> Dict[str, float]:
+    """Parses --scenario name=weight options, no options keeps the SCENARIOS defaults."""
+    if not values:
+        return {name: weight for name, (_, weight) in SCENARIOS.items()}
+    weights = {}
+    for value in values:
+        name, _, weight = value.partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name}', pick from: {', '.join(SCENARIOS)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.api_load", description="Weighted load test of the Not-Alone REST API."
+    )
+    parser.add_argument("--rate", type=float, default=20, help="Scenarios started per second.")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to generate load for.")
+    parser.add_argument("--concurrency", type=int, default=50, help="Calls in flight at most.")
+    parser.add_argument("--scenario", action="append", default=[], metavar="NAME=WEIGHT",
+                        help=f"Scenario mix, repeatable. Scenarios: {', '.join(SCENARIOS)}.")
+    parser.add_argument("--seed", type=int, default=0)
+    add_server_arguments(parser)
+    parser.add_argument("--json", dest="json_path", help="Also write the summary to this JSON file.")
+    args = parser.parse_args(argv)
+
+    try:
+        weights = parse_weights(args.scenario)
+    except ValueError as e:
+        parser.error(str(e))
+
+    with target_server(args) as user_ids:
+        client, run = asyncio.run(generate_load(
+            prepare_fixtures(user_ids), weights, args.rate, args.duration, args.concurrency, args.seed
+        ))
+
+    summary = summarize(client.samples, run["elapsed"])
+    print(format_summary(summary, run))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"run": run, "weights": weights, "summary": summary}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
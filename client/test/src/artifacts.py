@@ -0,0 +1,161 @@
+import fnmatch
+import io
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+from allure_commons import plugin_manager
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment, TestResult
+
+try:
+    from PIL import Image
+except ImportError:  # optional, screenshots are then stored as the original PNG
+    Image = None
+
+# Failure screenshots wider than this are scaled down before they are stored
+SCREENSHOT_MAX_WIDTH = 1280
+SCREENSHOT_WEBP_QUALITY = 80
+SCREENSHOT_EXTENSION = "webp" if Image else "png"
+SCREENSHOT_MIME = f"image/{SCREENSHOT_EXTENSION}"
+
+# Attachment files among the allure results, the only ones the retention limits prune there
+ALLURE_ATTACHMENT_GLOB = ATTACHMENT_PATTERN.format(prefix="*", ext="*")
+
+
+def compress_screenshot(png: bytes, max_width: int = SCREENSHOT_MAX_WIDTH):
+    """
+    Scales a PNG screenshot down to `max_width` and re-encodes it as WebP.
+    Without Pillow installed the PNG is returned unchanged.
+
+    :return: (image bytes, file extension, mime type)
+    """
+    if Image is None:
+        return png, "png", "image/png"
+
+    image = Image.open(io.BytesIO(png))
+    if image.width > max_width:
+        image = image.resize((max_width, round(image.height * max_width / image.width)))
+    buffer = io.BytesIO()
+    image.save(buffer, "WEBP", quality=SCREENSHOT_WEBP_QUALITY, method=4)
+    return buffer.getvalue(), "webp", "image/webp"
+
+
+def prune_directory(directory: str, max_files: int, max_bytes: int, pattern: str = "*") -> int:
+    """
+    Deletes the oldest files in `directory` until at most `max_files`
+    files totalling at most `max_bytes` are left.
+
+    :param pattern: Only files whose name matches this glob count and are deleted.
+    :return:        Number of files deleted.
+    """
+    entries = []
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path) and fnmatch.fnmatch(name, pattern):
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+
+    total = sum(size for _, size, _ in entries)
+    deleted = 0
+    while entries and (len(entries) > max_files or total > max_bytes):
+        _, size, path = entries.pop(0)
+        os.remove(path)
+        total -= size
+        deleted += 1
+    return deleted
+
+
+def reserve_allure_attachment(config, name: str, extension: str, mime: str) -> Optional[str]:
+    """
+    Adds an attachment to the allure result of the running test before its
+    file exists, so the test doesn't wait for the artifact to be encoded.
+    The file is written later through allure's own file logger (ArtifactWriter).
+
+    :return: File name of the attachment, None when allure is not reporting.
+    """
+    listener = config.pluginmanager.getplugin("allure_listener")
+    test_result = listener.allure_logger.get_last_item(TestResult) if listener else None
+    if test_result is None:
+        return None
+    file_name = ATTACHMENT_PATTERN.format(prefix=uuid4(), ext=extension)
+    test_result.attachments.append(Attachment(source=file_name, name=name, type=mime))
+    return file_name
+
+
+class ArtifactWriter:
+    """
+    Encodes, compresses and stores failure artifacts on a background thread,
+    so a failing test only pays for grabbing the screenshot and page source
+    from the browser. One thread writes everything, which keeps the
+    retention pruning free of races. Nothing waits for a single failure,
+    close() waits for all of them at the end of the session.
+
+    :param directory: Where the artifacts are written (screenshots dir).
+    :param max_files: Retention limit on the number of files kept.
+    :param max_bytes: Retention limit on the total size of the directory.
+    """
+
+    def __init__(self, directory: str, max_files: int = 200, max_bytes: int = 200 * 1024 * 1024):
+        self.directory = directory
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        # (base name, future) of every queued failure, checked by close()
+        self.futures: List[tuple] = []
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+
+    def submit(self, base_name: str, png: Optional[bytes], page_source: Optional[str],
+               allure_files: Optional[Dict[str, str]] = None) -> Future:
+        """
+        Queues the artifacts of one failure. The future resolves to a list of
+        {"name", "path", "body", "mime", "extension"}.
+
+        :param allure_files: Artifact name ("Screenshot", "Page source") -> file name
+                             of its reserved allure attachment, also written.
+        """
+        future = self._executor.submit(self._write, base_name, png, page_source, allure_files or {})
+        self.futures.append((base_name, future))
+        return future
+
+    def _write(self, base_name: str, png: Optional[bytes], page_source: Optional[str],
+               allure_files: Dict[str, str]):
+        artifacts = []
+        if png is not None:
+            body, extension, mime = compress_screenshot(png)
+            artifacts.append({"name": "Screenshot", "body": body, "mime": mime, "extension": extension})
+        if page_source is not None:
+            # kept as plain HTML, allure shows it inline
+            artifacts.append({"name": "Page source", "body": page_source.encode("utf-8"),
+                              "mime": "text/html", "extension": "html"})
+
+        for artifact in artifacts:
+            artifact["path"] = os.path.join(self.directory, f"{base_name}.{artifact['extension']}")
+            with open(artifact["path"], "wb") as f:
+                f.write(artifact["body"])
+            if artifact["name"] in allure_files:
+                plugin_manager.hook.report_attached_data(
+                    body=artifact["body"], file_name=allure_files[artifact["name"]]
+                )
+        prune_directory(self.directory, self.max_files, self.max_bytes)
+        return artifacts
+
+    def close(self) -> List[str]:
+        """
+        Waits for every queued failure to be written.
+
+        :return: One message per failure whose artifacts could not be stored.
+        """
+        self._executor.shutdown(wait=True)
+        return [f"{base_name}: {future.exception()}" for base_name, future in self.futures if future.exception()]
+
+    def prune_merged(self, directory: str, pattern: str = "*") -> int:
+        """
+        Applies the retention limits to a directory the per-worker folders were
+        merged into, whose files no single worker's writer has seen together.
+
+        :return: Number of files deleted.
+        """
+        if not os.path.isdir(directory):
+            return 0
+        return prune_directory(directory, self.max_files, self.max_bytes, pattern)
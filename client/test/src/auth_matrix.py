@@ -0,0 +1,264 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import requests
+
+from src.api_client import USER_TYPES, api_url, auth_headers, build_session, get_token
+from src.server_process import SERVER_DIR, add_server_arguments, target_server
+
+SERVER_SRC = os.path.join(SERVER_DIR, "src")
+
+# Requests sent without a token
+ANONYMOUS = "anonymous"
+
+# What the auth and checkUserType middlewares let through
+ALLOWED = "allowed"
+UNAUTHENTICATED = "unauthenticated"
+FORBIDDEN = "forbidden"
+
+# Error messages of middleware/auth.ts, told apart from a controller's own 401s
+AUTH_ERRORS = {"Authentication required", "Invalid authentication token", "User not found"}
+# middleware/checkUserType.ts
+FORBIDDEN_PREFIX = "Access denied. Only"
+
+# Valid ObjectId no document has, so routes with ids reach their controller without touching data
+DUMMY_ID = "0" * 24
+
+# Routes never called because they send real email: POST /api/email to a fixed address, the
+# 2FA and password reset code generators (services/create2FA.ts) to any user they find
+SKIPPED_ROUTES = {
+    ("POST", "/api/email"),
+    ("POST", "/api/auth/verify-2fa/reset-password/generate"),
+    ("POST", "/api/verify-2fa/generate"),
+}
+
+_ROUTER_CALL = re.compile(r"\brouter\.(get|post|put|patch|delete)\s*\(")
+_IMPORT = re.compile(r'import\s+(\w+)\s+from\s+"\./routes/(\w+)"')
+_MOUNT = re.compile(r'app\.use\(\s*"([^"]+)"\s*,\s*(\w+)\s*\)')
+_USER_TYPES = re.compile(r"checkUserType\(\s*\[([^\]]*)\]")
+
+
+class Route(NamedTuple):
+    method: str
+    path: str
+    auth: bool
+    # None when any authenticated user may call it
+    user_types: Optional[Tuple[str, ...]]
+    source: str
+
+
+def _call_arguments(text: str, start: int) -> Tuple[str, int]:
+    """Returns the text between the parenthesis at `start` and its closing one, skipping strings."""
+    depth, index, quote = 0, start, None
+    while index < len(text):
+        char = text[index]
+        if quote:
+            if char == "\\":
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in "\"'`":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:index], index
+        index += 1
+    raise ValueError("Unbalanced parentheses")
+
+
+def _split_top_level(arguments: str) -> List[str]:
+    """Splits call arguments on the commas outside brackets and strings."""
+    parts, depth, current, quote, escaped = [], 0, "", None, False
+    for char in arguments:
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'`":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        if char == "," and depth == 0 and not quote:
+            parts.append(current.strip())
+            current = ""
+        else:
+            current += char
+    parts.append(current.strip())
+    return parts
+
+
+def parse_routes(source: str, prefix: str, file_name: str = "") -> List[Route]:
+    """
+    Reads the router.<method>("path", ...middlewares, handler) calls of one
+    routes file. A route requires a login when `auth` is one of its
+    middlewares, and only the listed user types (plus Admin) when it also has
+    checkUserType([...]).
+    """
+    routes = []
+    for match in _ROUTER_CALL.finditer(source):
+        arguments, _ = _call_arguments(source, match.end() - 1)
+        parts = _split_top_level(arguments)
+        path = parts[0].strip("\"'`")
+        types = _USER_TYPES.search(arguments)
+        line = source.count("\n", 0, match.start()) + 1
+        routes.append(Route(
+            method=match.group(1).upper(),
+            path=prefix.rstrip("/") + ("" if path == "/" else f"/{path.lstrip('/')}"),
+            auth="auth" in parts[1:],
+            user_types=tuple(re.findall(r"[\"'](\w+)[\"']", types.group(1))) if types else None,
+            source=f"{file_name}:{line}",
+        ))
+    return routes
+
+
+def discover_routes(server_src: str = SERVER_SRC) -> List[Route]:
+    """Every route of every routes/*.ts file mounted with app.use() in index.ts, in declaration order."""
+    with open(os.path.join(server_src, "index.ts"), encoding="utf-8") as f:
+        index = f.read()
+    files = dict(_IMPORT.findall(index))
+    routes = []
+    for prefix, name in _MOUNT.findall(index):
+        if name not in files:
+            continue
+        file_name = f"{files[name]}.ts"
+        with open(os.path.join(server_src, "routes", file_name), encoding="utf-8") as f:
+            routes += parse_routes(f.read(), prefix, file_name)
+    return routes
+
+
+def expected_outcome(route: Route, role: str) -> str:
+    if not route.auth:
+        return ALLOWED
+    if role == ANONYMOUS:
+        return UNAUTHENTICATED
+    user_type = USER_TYPES[role]
+    if route.user_types is None or user_type == "Admin" or user_type in route.user_types:
+        return ALLOWED
+    return FORBIDDEN
+
+
+def expected_table(routes: List[Route], roles: List[str]) -> Dict[str, Dict[str, str]]:
+    """"METHOD path" -> role -> expected outcome, as saved by --write-expected."""
+    return {f"{route.method} {route.path}": {role: expected_outcome(route, role) for role in roles}
+            for route in routes}
+
+
+def classify(status: Optional[int], body) -> str:
+    """Which middleware (if any) stopped a request, from its status and JSON body."""
+    error = body.get("error") if isinstance(body, dict) else None
+    if status == 401 and error in AUTH_ERRORS:
+        return UNAUTHENTICATED
+    if status == 403 and isinstance(error, str) and error.startswith(FORBIDDEN_PREFIX):
+        return FORBIDDEN
+    return ALLOWED
+
+
+def run_matrix(routes: List[Route], roles: List[str], workers: int = 32) -> List[dict]:
+    """
+    Calls every route as every role at the same time over one pooled
+    session, with DUMMY_ID for path parameters and an empty JSON body.
+    Tokens are fetched once per role first.
+
+    :return: One {"route", "role", "status", "outcome"} per call, outcome None when it got no answer.
+    """
+    tokens = {role: None if role == ANONYMOUS else get_token(role) for role in roles}
+    session = build_session(workers, retries=0)
+
+    def call(route: Route, role: str) -> dict:
+        path = re.sub(r":\w+", DUMMY_ID, route.path)
+        headers = auth_headers(tokens[role]) if tokens[role] else {}
+        body = {} if route.method in ("POST", "PUT", "PATCH") else None
+        try:
+            response = session.request(route.method, api_url(path[len("/api"):]), headers=headers,
+                                       json=body, timeout=30)
+        except requests.RequestException as e:
+            return {"route": route, "role": role, "status": None, "outcome": None, "error": type(e).__name__}
+        try:
+            response_body = response.json()
+        except ValueError:
+            response_body = None
+        return {"route": route, "role": role, "status": response.status_code,
+                "outcome": classify(response.status_code, response_body)}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="auth-matrix") as executor:
+        futures = [executor.submit(call, route, role) for route in routes for role in roles]
+        return [future.result() for future in futures]
+
+
+def mismatches(results: List[dict], expected: Dict[str, Dict[str, str]]) -> List[str]:
+    """One line per call whose outcome differs from the expected table."""
+    lines = []
+    for result in results:
+        route, role = result["route"], result["role"]
+        want = expected.get(f"{route.method} {route.path}", {}).get(role)
+        if want is not None and result["outcome"] != want:
+            got = result["outcome"] or result.get("error")
+            lines.append(f"{route.method} {route.path} as {role}: expected {want}, got {got} "
+                         f"(HTTP {result['status']}, {route.source})")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.auth_matrix", description="Every endpoint x every user type access check."
+    )
+    add_server_arguments(parser, required=False)
+    parser.add_argument("--workers", type=int, default=32, help="Calls in flight at most.")
+    parser.add_argument("--expected", help="Saved expected table (JSON) to compare with instead of "
+                                           "the one derived from the route declarations.")
+    parser.add_argument("--write-expected", help="Write the table derived from the route declarations and exit.")
+    parser.add_argument("--show-server-errors", action="store_true", help="List calls answered with a 5xx.")
+    args = parser.parse_args(argv)
+
+    routes = [route for route in discover_routes() if (route.method, route.path) not in SKIPPED_ROUTES]
+    roles = list(USER_TYPES) + [ANONYMOUS]
+    derived = expected_table(routes, roles)
+    if args.write_expected:
+        with open(args.write_expected, "w", encoding="utf-8") as f:
+            json.dump(derived, f, indent=2)
+        print(f"{len(derived)} routes written to {args.write_expected}")
+        return 0
+    if not (args.start_server or args.base_url):
+        parser.error("one of the arguments --start-server --base-url is required")
+    if args.expected:
+        with open(args.expected, encoding="utf-8") as f:
+            expected = json.load(f)
+    else:
+        expected = derived
+
+    with target_server(args):
+        start = time.perf_counter()
+        results = run_matrix(routes, roles, args.workers)
+        elapsed = time.perf_counter() - start
+
+    failed = mismatches(results, expected)
+    for line in failed:
+        print(f"MISMATCH {line}")
+    server_errors = [result for result in results if (result["status"] or 0) >= 500]
+    if args.show_server_errors:
+        for result in server_errors:
+            print(f"HTTP {result['status']} {result['route'].method} {result['route'].path} as {result['role']}")
+    missing = [key for key in expected if key not in derived]
+    for key in missing:
+        print(f"MISSING {key} is in the expected table but no longer declared")
+    print(f"{len(results)} calls ({len(routes)} routes x {len(roles)} roles) in {elapsed:.1f}s: "
+          f"{len(failed)} mismatches, {len(server_errors)} answered with 5xx")
+    return 1 if failed or missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
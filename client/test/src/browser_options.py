@@ -0,0 +1,74 @@
+from typing import Tuple
+
+from selenium.webdriver.chrome.options import Options
+
+# Chrome switches that cut startup and background work on CI runners
+PERFORMANCE_ARGUMENTS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
+
+def parse_window_size(value: str) -> Tuple[int, int]:
+    """
+    Parses '1920,1080' or '1920x1080' into (width, height).
+
+    :raises ValueError: When the value is not two positive integers.
+    """
+    try:
+        width, height = (int(part) for part in value.lower().replace("x", ",").split(","))
+    except ValueError:
+        raise ValueError(f"--window-size must be WIDTH,HEIGHT (e.g. 1920,1080), got '{value}'") from None
+    if width <= 0 or height <= 0:
+        raise ValueError(f"--window-size must be positive, got '{value}'")
+    return width, height
+
+
+def set_viewport(driver, width: int, height: int):
+    """
+    Fixes the page viewport through CDP device metrics emulation: unlike the
+    window size it doesn't depend on the OS window, the browser chrome or
+    the headless default window, so layouts and screenshots are identical
+    headed and headless.
+    """
+    driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+        "width": width,
+        "height": height,
+        "deviceScaleFactor": 1,
+        "mobile": False,
+    })
+
+
+def build_chrome_options(mode: str = "headed", disable_images: bool = False) -> Options:
+    """
+    Builds the Chrome options for a test browser. The viewport is set per
+    browser with set_viewport() once it has started.
+
+    :param mode:           'headless' (new headless mode + performance switches) or 'headed'.
+    :param disable_images: Skip downloading and decoding images.
+    :return:               Options for webdriver.Chrome.
+    """
+    options = Options()
+
+    if mode == "headless":
+        options.add_argument("--headless=new")
+        options.add_argument("--hide-scrollbars")
+        for argument in PERFORMANCE_ARGUMENTS:
+            options.add_argument(argument)
+
+    if disable_images:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    return options
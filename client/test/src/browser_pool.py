@@ -0,0 +1,107 @@
+import time
+from typing import Callable, List, Optional
+from urllib.parse import urlparse
+
+from src.config import CONFIG
+
+# Clears storage for the origin the browser is currently on
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+# What Storage.clearDataForOrigin removes for the site, whichever page the browser is on
+SITE_STORAGE_TYPES = "local_storage,session_storage,indexeddb,cache_storage"
+
+
+def site_origin(base_url: Optional[str] = None) -> str:
+    """scheme://host[:port] of the configured site, the form CDP storage calls take."""
+    parts = urlparse(base_url or CONFIG.base_url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def reset_browser(driver) -> float:
+    """
+    Brings a used browser back to a clean state without restarting it:
+    closes every extra tab, clears the storage of the current page and of
+    the configured site (also when a test left the browser on another origin
+    or about:blank), clears all cookies and parks the remaining tab on
+    about:blank.
+
+    :param driver: Selenium WebDriver instance.
+    :return:       How long the reset took, in seconds.
+    """
+    start = time.perf_counter()
+
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    # Storage is per origin, so it has to be cleared before leaving the page
+    driver.execute_script(CLEAR_STORAGE_SCRIPT)
+    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+        "origin": site_origin(), "storageTypes": SITE_STORAGE_TYPES
+    })
+    try:
+        # Clears cookies of every domain, not only the current one
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    except Exception:
+        driver.delete_all_cookies()
+    driver.get("about:blank")
+
+    return time.perf_counter() - start
+
+
+class BrowserPool:
+    """
+    Keeps already started browsers around so tests can get an isolated
+    browser without paying Chrome startup each time.
+
+    :param factory: Callable that starts a new WebDriver.
+    :param size:    How many browsers to start up front.
+    """
+
+    def __init__(self, factory: Callable, size: int = 1):
+        self.factory = factory
+        self.idle: List = []
+        self.all: List = []
+        for _ in range(size):
+            self.idle.append(self._launch())
+
+    def _launch(self):
+        driver = self.factory()
+        self.all.append(driver)
+        return driver
+
+    def acquire(self):
+        """Returns a warm browser, starting a new one only if none is idle."""
+        if self.idle:
+            return self.idle.pop()
+        return self._launch()
+
+    def release(self, driver) -> float:
+        """
+        Resets the browser and puts it back in the pool. A browser that
+        fails to reset is quit and replaced on the next acquire().
+
+        :return: Reset duration in seconds.
+        """
+        try:
+            duration = reset_browser(driver)
+        except Exception:
+            self.all.remove(driver)
+            driver.quit()
+            raise
+        self.idle.append(driver)
+        return duration
+
+    def close(self):
+        for driver in self.all:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Warning: Could not quit pooled browser: {str(e)}")
+        self.all.clear()
+        self.idle.clear()
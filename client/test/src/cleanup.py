@@ -0,0 +1,75 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from src.api_client import SESSION, api_url, auth_headers, get_token
+
+# Resource kind -> DELETE endpoint. Users go last so their own content is removed first.
+CLEANUP_ENDPOINTS = {
+    "posts": "/posts/{id}",
+    "requests": "/requests/{id}",
+    "donations": "/donations/{id}",
+    "users": "/users/{id}",
+}
+
+
+class CleanupRegistry:
+    """
+    Collects ids of resources created by tests and deletes them all at the
+    end of the session, instead of each test cleaning up in-line.
+    """
+
+    def __init__(self):
+        self.resources: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def add(self, kind: str, resource_id: str):
+        """
+        :param kind:        One of CLEANUP_ENDPOINTS ('users', 'posts', 'requests', 'donations').
+        :param resource_id: The resource's _id.
+        """
+        if kind not in CLEANUP_ENDPOINTS:
+            raise ValueError(f"Unknown cleanup kind: {kind}")
+        with self._lock:
+            self.resources.append((kind, resource_id))
+
+    def _delete(self, token: str, kind: str, resource_id: str):
+        response = SESSION.delete(
+            api_url(CLEANUP_ENDPOINTS[kind].format(id=resource_id)),
+            headers=auth_headers(token)
+        )
+        # Already gone counts as cleaned up
+        if response.status_code != 404:
+            response.raise_for_status()
+
+    def run(self, role: str = "admin", max_workers: int = 8) -> List[str]:
+        """
+        Deletes every registered resource concurrently over the shared API
+        session, kind by kind in CLEANUP_ENDPOINTS order.
+
+        :param role:        Account used for the deletes.
+        :param max_workers: Parallel DELETE requests.
+        :return:            One "kind/id: error" line per resource that could not be deleted.
+        """
+        with self._lock:
+            resources, self.resources = self.resources, []
+        if not resources:
+            return []
+
+        failures = []
+        try:
+            token = get_token(role)
+        except Exception as e:
+            return [f"{kind}/{resource_id}: login as {role} failed: {e}" for kind, resource_id in resources]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for kind in CLEANUP_ENDPOINTS:
+                batch = [resource_id for resource_kind, resource_id in resources if resource_kind == kind]
+                futures = [(resource_id, executor.submit(self._delete, token, kind, resource_id))
+                           for resource_id in batch]
+                for resource_id, future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failures.append(f"{kind}/{resource_id}: {e}")
+        return failures
@@ -0,0 +1,61 @@
+import os
+from urllib.parse import urlparse
+
+DEFAULT_BASE_URL = "https://notalonesoldier.com"
+
+
+class TestConfig:
+    """
+    Where the suite points: the live site, a staging box or the local
+    stand-in. Set from --base-url / NOT_ALONE_BASE_URL in conftest.
+    """
+
+    # not a test class, keep pytest from trying to collect it
+    __test__ = False
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL):
+        self.base_url = base_url
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str):
+        self._base_url = value.rstrip("/")
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/api"
+
+
+CONFIG = TestConfig(os.environ.get("NOT_ALONE_BASE_URL", DEFAULT_BASE_URL))
+
+
+def url(path: str = "/") -> str:
+    """
+    Builds a page URL on the configured site, e.g. url("/login").
+    Raises ValueError for a full URL, which would otherwise get the origin twice.
+    """
+    if urlparse(path).scheme in ("http", "https"):
+        raise ValueError(f"url() takes a path on the configured site, not a full URL: {path}")
+    return f"{CONFIG.base_url}/{path.lstrip('/')}"
+
+
+def url_path(full_url: str) -> str:
+    """Returns only the path of a URL, so checks don't depend on the origin."""
+    return urlparse(full_url).path or "/"
+
+
+def current_path(driver) -> str:
+    return url_path(driver.current_url)
+
+
+def path_is(path: str):
+    """
+    Expected condition for WebDriverWait that is true once the browser is on
+    `path` of the configured site, e.g. wait.until(path_is("/admin/queue")).
+    """
+    def _predicate(driver):
+        return driver.current_url.startswith(CONFIG.base_url) and current_path(driver) == path
+    return _predicate
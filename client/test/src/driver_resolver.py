@@ -0,0 +1,145 @@
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+
+# Pinned chromedriver binaries live in <cache>/<full chrome version>/chromedriver[.exe]
+DRIVER_CACHE_DIR = os.environ.get(
+    "CHROMEDRIVER_CACHE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "drivers")
+)
+DRIVER_FILE = "chromedriver.exe" if sys.platform.startswith("win") else "chromedriver"
+
+VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+# Commands that print the installed Chrome version, tried in order
+CHROME_VERSION_COMMANDS: List[List[str]] = [
+    ["google-chrome", "--version"],
+    ["google-chrome-stable", "--version"],
+    ["chromium", "--version"],
+    ["chromium-browser", "--version"],
+    ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+    ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+    ["reg", "query", r"HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon", "/v", "version"],
+]
+
+
+class DriverResolutionError(Exception):
+    """Raised when no pinned chromedriver matches the installed Chrome."""
+
+
+def _parse_version(text: str) -> Optional[str]:
+    match = VERSION_PATTERN.search(text or "")
+    return match.group(0) if match else None
+
+
+def get_chrome_version() -> Optional[str]:
+    """
+    Returns the installed Chrome version (e.g. '133.0.6943.98') without any
+    network access. CHROME_VERSION overrides detection, CHROME_BINARY is
+    asked first when set.
+    """
+    if os.environ.get("CHROME_VERSION"):
+        return _parse_version(os.environ["CHROME_VERSION"])
+
+    commands = list(CHROME_VERSION_COMMANDS)
+    if os.environ.get("CHROME_BINARY"):
+        commands.insert(0, [os.environ["CHROME_BINARY"], "--version"])
+
+    for command in commands:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        version = _parse_version(output)
+        if version:
+            return version
+    return None
+
+
+def find_cached_driver(chrome_version: str, cache_dir: str = DRIVER_CACHE_DIR) -> Optional[str]:
+    """
+    Looks for a pinned chromedriver for `chrome_version`. An exact version
+    match wins, otherwise the newest cached build of the same major version
+    is used (chromedriver is compatible within a major release).
+    """
+    if not os.path.isdir(cache_dir):
+        return None
+
+    exact = os.path.join(cache_dir, chrome_version, DRIVER_FILE)
+    if os.path.isfile(exact):
+        return exact
+
+    major = chrome_version.split(".")[0]
+    candidates = []
+    for entry in os.listdir(cache_dir):
+        # only folders named exactly like a version, not 'latest' or a partial download
+        match = VERSION_PATTERN.fullmatch(entry)
+        path = os.path.join(cache_dir, entry, DRIVER_FILE)
+        if match and match.group(1) == major and os.path.isfile(path):
+            candidates.append((tuple(int(part) for part in match.groups()), path))
+    if not candidates:
+        return None
+    return max(candidates)[1]
+
+
+def resolve_driver(source: str = "local") -> Tuple[str, float]:
+    """
+    Resolves the chromedriver binary to start Chrome with.
+
+    :param source: 'local'   - pinned on-disk cache only, never touches the network.
+                   'manager' - webdriver_manager download/lookup (needs network).
+                   'auto'    - local cache first, webdriver_manager if nothing matches.
+    :return:       (path to chromedriver, resolution time in seconds)
+    :raises DriverResolutionError: When 'local' finds no matching binary.
+    """
+    start = time.perf_counter()
+
+    if source in ("local", "auto"):
+        chrome_version = get_chrome_version()
+        path = find_cached_driver(chrome_version) if chrome_version else None
+        if path:
+            return path, time.perf_counter() - start
+        if source == "local":
+            raise DriverResolutionError(
+                f"No pinned chromedriver for Chrome {chrome_version or '(not found)'} in {DRIVER_CACHE_DIR}. "
+                f"Pin one with 'python -m src.driver_resolver pin <path/to/chromedriver>' "
+                f"or run with --driver-source=auto to fall back to webdriver_manager."
+            )
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    return path, time.perf_counter() - start
+
+
+def pin_driver(driver_path: str, cache_dir: str = DRIVER_CACHE_DIR) -> str:
+    """
+    Copies a chromedriver binary into the cache under its own version,
+    so air-gapped machines can be provisioned by copying the cache folder.
+    """
+    output = subprocess.run([driver_path, "--version"], capture_output=True, text=True, timeout=5).stdout
+    version = _parse_version(output)
+    if not version:
+        raise DriverResolutionError(f"Could not read the version of {driver_path}: {output!r}")
+
+    target_dir = os.path.join(cache_dir, version)
+    os.makedirs(target_dir, exist_ok=True)
+    target = os.path.join(target_dir, DRIVER_FILE)
+    shutil.copy2(driver_path, target)
+    return target
+
+
+if __name__ == "__main__":
+    # python -m src.driver_resolver pin <path/to/chromedriver>
+    # python -m src.driver_resolver resolve
+    if len(sys.argv) == 3 and sys.argv[1] == "pin":
+        print(pin_driver(sys.argv[2]))
+    elif len(sys.argv) == 2 and sys.argv[1] == "resolve":
+        driver_path, seconds = resolve_driver("local")
+        print(f"{driver_path} ({seconds * 1000:.0f} ms)")
+    else:
+        print("usage: python -m src.driver_resolver pin <path/to/chromedriver> | resolve")
+        sys.exit(2)
@@ -0,0 +1,119 @@
+import os
+import sqlite3
+import statistics
+from typing import Dict, Iterable, List, Optional
+
+# Per-test durations of past runs, updated at the end of every run.
+# CI should cache this file between runs so --shard can balance on it.
+DURATIONS_DB = os.environ.get(
+    "TEST_DURATIONS_DB",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "durations.sqlite")
+)
+
+# Only this many latest runs of a test count towards its expected duration
+HISTORY_RUNS = 10
+
+# Expected duration of a test that never ran before and there is no history at all
+DEFAULT_SECONDS = 5.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    started     REAL,
+    base_url    TEXT,
+    browser     TEXT,
+    shard       TEXT,
+    workers     INTEGER,
+    platform    TEXT,
+    python      TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id      TEXT REFERENCES runs(run_id),
+    test        TEXT,
+    outcome     TEXT,
+    seconds     REAL,
+    worker      TEXT,
+    PRIMARY KEY (run_id, test)
+);
+CREATE INDEX IF NOT EXISTS results_test ON results(test);
+"""
+
+
+def connect(path: str = DURATIONS_DB) -> sqlite3.Connection:
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def record_run(run: dict, results: Iterable[dict], path: str = DURATIONS_DB):
+    """
+    Stores one run and its per-test results.
+
+    :param run:     Keys of the runs table: run_id, started, base_url, browser,
+                    shard, workers, platform, python.
+    :param results: One dict per test: test (nodeid), outcome, seconds, worker.
+    """
+    with connect(path) as connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO runs VALUES "
+            "(:run_id, :started, :base_url, :browser, :shard, :workers, :platform, :python)",
+            run
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO results VALUES (:run_id, :test, :outcome, :seconds, :worker)",
+            [{**result, "run_id": run["run_id"]} for result in results]
+        )
+    connection.close()
+
+
+def load_durations(path: str = DURATIONS_DB, history: int = HISTORY_RUNS) -> Dict[str, float]:
+    """
+    Returns the expected duration of every test that ran before: the median
+    of its latest `history` runs that weren't skipped.
+    """
+    if not os.path.exists(path):
+        return {}
+    connection = connect(path)
+    rows = connection.execute(
+        "SELECT results.test, results.seconds FROM results JOIN runs USING (run_id) "
+        "WHERE results.outcome != 'skipped' ORDER BY runs.started DESC"
+    ).fetchall()
+    connection.close()
+
+    history_by_test: Dict[str, List[float]] = {}
+    for test, seconds in rows:
+        runs = history_by_test.setdefault(test, [])
+        if len(runs) < history:
+            runs.append(seconds)
+    return {test: statistics.median(runs) for test, runs in history_by_test.items()}
+
+
+def parse_shard(value: str):
+    """Parses --shard 'i/N' (1-based) into (index, count)."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"--shard must look like i/N, got '{value}'") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"--shard index must be between 1 and {count}, got {index}")
+    return index, count
+
+
+def split_into_shards(tests: List[str], durations: Dict[str, float], count: int,
+                      default: Optional[float] = None) -> List[List[str]]:
+    """
+    Splits tests into `count` shards of about the same total expected
+    duration: longest test first, each into the shard that is lightest so
+    far. Tests without history count as the median known duration.
+    The result only depends on the tests and durations, so every machine
+    and xdist worker computes the same split.
+    """
+    if default is None:
+        default = statistics.median(durations.values()) if durations else DEFAULT_SECONDS
+    shards: List[List[str]] = [[] for _ in range(count)]
+    totals = [0.0] * count
+    for test in sorted(tests, key=lambda test: (-durations.get(test, default), test)):
+        lightest = min(range(count), key=lambda shard: (totals[shard], shard))
+        shards[lightest].append(test)
+        totals[lightest] += durations.get(test, default)
+    return shards
@@ -0,0 +1,231 @@
+import base64
+import json
+import mimetypes
+import os
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from src.api_client import TEST_USERS, USER_TYPES
+
+# The production build of the client, served by the Express server in production
+PUBLIC_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "Server", "public"
+)
+
+
+def _fake_jwt(user_id: str, lifetime: int = 24 * 3600) -> str:
+    """Unsigned JWT-shaped token so api_client can still read its expiry."""
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+    return ".".join([
+        encode({"alg": "none", "typ": "JWT"}),
+        encode({"userId": user_id, "exp": int(time.time()) + lifetime}),
+        "mock",
+    ])
+
+
+class MockApi:
+    """
+    In-memory stand-in for the routes the UI suite touches. Each handler
+    gets (api, request, match) and returns (status, json_body).
+    """
+
+    def __init__(self):
+        self.users: Dict[str, dict] = {}
+        self.tokens: Dict[str, str] = {}
+        self.profiles: Dict[str, dict] = {}
+        for role, credentials in TEST_USERS.items():
+            user_id = uuid.uuid4().hex[:24]
+            self.users[user_id] = {
+                "_id": user_id,
+                "firstName": role.capitalize(),
+                "lastName": "Test",
+                "email": credentials["email"],
+                "password": credentials["password"],
+                "phone": "+1234567890",
+                "type": USER_TYPES[role],
+                "approvalStatus": "approved",
+                "is2FAEnabled": True,
+            }
+        self.routes: List[Tuple[str, re.Pattern, Callable]] = [
+            ("POST", re.compile(r"^/api/auth/login$"), MockApi.login),
+            ("POST", re.compile(r"^/api/auth/register$"), MockApi.register),
+            ("GET", re.compile(r"^/api/users/me$"), MockApi.me),
+            ("GET", re.compile(r"^/api/users/pending$"), MockApi.pending_users),
+            ("DELETE", re.compile(r"^/api/users/(?P<id>[^/]+)$"), MockApi.delete_user),
+            ("GET", re.compile(r"^/api/profiles/me$"), MockApi.get_profile),
+            ("PUT", re.compile(r"^/api/profiles/me$"), MockApi.update_profile),
+            ("GET", re.compile(r"^/api/posts/user/[^/]+$"), MockApi.empty_page("posts")),
+            ("GET", re.compile(r"^/api/requests/user/[^/]+$"), MockApi.empty_list("requests")),
+            ("GET", re.compile(r"^/api/(channels|cities|cities/me|cities/my-pending-requests)$"),
+             MockApi.empty_list(None)),
+            ("DELETE", re.compile(r"^/api/(posts|requests|donations)/[^/]+$"), MockApi.deleted),
+        ]
+
+    @staticmethod
+    def public_user(user: dict) -> dict:
+        return {key: value for key, value in user.items() if key != "password"}
+
+    def current_user(self, request) -> Optional[dict]:
+        header = request.headers.get("Authorization", "")
+        user_id = self.tokens.get(header.replace("Bearer ", "", 1))
+        return self.users.get(user_id)
+
+    def dispatch(self, method: str, path: str, request) -> Tuple[int, object]:
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                return handler(self, request, match)
+        return 404, {"message": f"Mock API has no route for {method} {path}"}
+
+    def login(self, request, match):
+        body = request.json()
+        for user in self.users.values():
+            if user["email"] == body.get("email") and user["password"] == body.get("password"):
+                token = _fake_jwt(user["_id"])
+                self.tokens[token] = user["_id"]
+                return 200, {"token": token, "user": self.public_user(user)}
+        return 401, {"message": "Invalid email or password"}
+
+    def register(self, request, match):
+        body = request.json()
+        user_id = uuid.uuid4().hex[:24]
+        user = {key: value for key, value in body.items() if key != "confirmPassword"}
+        user.update({"_id": user_id, "approvalStatus": "pending", "is2FAEnabled": False})
+        self.users[user_id] = user
+        return 201, {"user": self.public_user(user)}
+
+    def me(self, request, match):
+        user = self.current_user(request)
+        if not user:
+            return 401, {"message": "Unauthorized"}
+        return 200, {"user": self.public_user(user)}
+
+    def pending_users(self, request, match):
+        pending = [self.public_user(user) for user in self.users.values() if user["approvalStatus"] == "pending"]
+        return 200, {"users": pending}
+
+    def delete_user(self, request, match):
+        if not self.users.pop(match.group("id"), None):
+            return 404, {"message": "User not found"}
+        return 200, {"message": "User deleted successfully"}
+
+    def get_profile(self, request, match):
+        user = self.current_user(request)
+        if not user:
+            return 401, {"message": "Unauthorized"}
+        return 200, self.profiles.setdefault(user["_id"], {
+            "nickname": "", "bio": "", "profileImage": "", "receiveNotifications": False
+        })
+
+    def update_profile(self, request, match):
+        status, profile = self.get_profile(request, match)
+        if status != 200:
+            return status, profile
+        profile.update(request.json())
+        return 200, profile
+
+    def deleted(self, request, match):
+        return 200, {"message": "Deleted successfully"}
+
+    @staticmethod
+    def empty_list(key: Optional[str]):
+        def handler(api, request, match):
+            return 200, ({key: []} if key else [])
+        return handler
+
+    @staticmethod
+    def empty_page(key: str):
+        def handler(api, request, match):
+            return 200, {key: [], "pagination": {"page": 1, "total": 0, "pages": 0}}
+        return handler
+
+
+def _is_within(path: str, directory: str) -> bool:
+    # A prefix check would also accept a sibling like public-old/ for public/
+    try:
+        return os.path.commonpath([path, directory]) == directory
+    except ValueError:  # on another drive
+        return False
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "LocalServer"
+
+    def log_message(self, message_format, *args):
+        pass
+
+    def json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _handle(self):
+        path = urlparse(self.path).path
+        if path.startswith("/api/"):
+            self.server.delay(self.server.latency_ms)
+            status, body = self.server.api.dispatch(self.command, path, self)
+            self._send(status, json.dumps(body).encode(), "application/json")
+            return
+
+        self.server.delay(self.server.static_latency_ms)
+        file_path = os.path.normpath(os.path.join(self.server.public_dir, path.lstrip("/")))
+        # Unknown paths (client-side routes like /login) and anything outside public_dir get index.html
+        if not _is_within(file_path, self.server.public_dir) or not os.path.isfile(file_path):
+            file_path = os.path.join(self.server.public_dir, "index.html")
+        with open(file_path, "rb") as f:
+            content = f.read()
+        self._send(200, content, mimetypes.guess_type(file_path)[0] or "application/octet-stream")
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+
+class LocalServer(ThreadingHTTPServer):
+    """
+    Serves the built SPA from Server/public with SPA fallback routing and a
+    mock /api on one local port.
+
+    :param latency_ms:        Delay added to every /api response, can be changed while running.
+    :param static_latency_ms: Delay added to every static file response.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency_ms: float = 0, static_latency_ms: float = 0,
+                 public_dir: str = PUBLIC_DIR):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.public_dir = os.path.abspath(public_dir)
+        self.latency_ms = latency_ms
+        self.static_latency_ms = static_latency_ms
+        self.api = MockApi()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    @staticmethod
+    def delay(milliseconds: float):
+        if milliseconds:
+            time.sleep(milliseconds / 1000)
+
+    def start(self) -> "LocalServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
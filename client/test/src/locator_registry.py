@@ -0,0 +1,120 @@
+import ast
+import importlib
+import os
+from typing import Dict, Iterable, List, Tuple
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+# (page, element_name) -> xpath, filled once per session by load_locators()
+LOCATOR_REGISTRY: Dict[Tuple[str, str], str] = {}
+
+
+class LocatorRegistryError(Exception):
+    """Raised when a locators.py file or a test references an invalid locator."""
+
+
+def _iter_pages(pages_dir: str) -> Iterable[str]:
+    for page in sorted(os.listdir(pages_dir)):
+        if os.path.isfile(os.path.join(pages_dir, page, "locators.py")):
+            yield page
+
+
+def load_locators(pages_dir: str = PAGES_DIR) -> Dict[Tuple[str, str], str]:
+    """
+    Imports every pages/<page>/locators.py once and flattens their LOCATORS
+    lists into a single dict keyed by (page, name).
+
+    :param pages_dir: Directory holding one sub-package per page.
+    :return:          The populated LOCATOR_REGISTRY.
+    :raises LocatorRegistryError: On an entry without a name/xpath or a
+                                  name declared twice on the same page.
+    """
+    registry: Dict[Tuple[str, str], str] = {}
+    errors: List[str] = []
+
+    for page in _iter_pages(pages_dir):
+        locators_module = importlib.import_module(f"src.pages.{page}.locators")
+        for index, locator in enumerate(getattr(locators_module, "LOCATORS", [])):
+            name = locator.get("name")
+            xpath = locator.get("xpath")
+            if not name or not xpath:
+                errors.append(f"{page}/locators.py entry #{index} is missing a name or xpath")
+                continue
+            if (page, name) in registry:
+                errors.append(f"{page}/locators.py declares '{name}' more than once")
+                continue
+            registry[(page, name)] = xpath
+
+    if errors:
+        raise LocatorRegistryError("\n".join(errors))
+
+    LOCATOR_REGISTRY.clear()
+    LOCATOR_REGISTRY.update(registry)
+    return LOCATOR_REGISTRY
+
+
+def get_locator(page: str, element_name: str):
+    """
+    Returns the xpath registered for (page, element_name), or None.
+    Loads the registry lazily when used outside a pytest session.
+    """
+    if not LOCATOR_REGISTRY:
+        load_locators()
+    return LOCATOR_REGISTRY.get((page, element_name))
+
+
+# helper name -> (positional index of page, names of locator arguments)
+_LOCATOR_CALLS = {
+    "wait_for_element": ("page", ["element_name"]),
+    "wait_until_visible": ("page", ["element_name"]),
+    "assert_link_href": ("page", ["element_name"]),
+    "validate_input": ("page", ["input_element", "error_element"]),
+}
+_POSITIONAL_ARGS = {
+    "wait_for_element": ["driver", "page", "element_name"],
+    "wait_until_visible": ["driver", "page", "element_name"],
+    "assert_link_href": ["driver", "page", "element_name"],
+    "validate_input": ["driver", "page", "input_element", "error_element", "mode"],
+}
+
+
+def _literal_arguments(call: ast.Call, helper: str) -> Dict[str, str]:
+    arguments = {}
+    for position, arg in enumerate(call.args):
+        if position < len(_POSITIONAL_ARGS[helper]) and isinstance(arg, ast.Constant):
+            arguments[_POSITIONAL_ARGS[helper][position]] = arg.value
+    for keyword in call.keywords:
+        if keyword.arg and isinstance(keyword.value, ast.Constant):
+            arguments[keyword.arg] = keyword.value.value
+    return arguments
+
+
+def find_missing_references(paths: Iterable[str]) -> List[str]:
+    """
+    Statically scans test modules for wait_for_element/validate_input calls
+    that use literal page and element names, and reports every name that is
+    not in the registry. Calls built from variables are skipped.
+
+    :param paths: Python files to scan.
+    :return:      One "file:line page/name" string per unknown locator.
+    """
+    missing = []
+    for path in paths:
+        with open(path, encoding="utf-8") as source:
+            tree = ast.parse(source.read(), filename=path)
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call):
+                continue
+            helper = getattr(node.func, "id", None) or getattr(node.func, "attr", None)
+            if helper not in _LOCATOR_CALLS:
+                continue
+            page_arg, name_args = _LOCATOR_CALLS[helper]
+            arguments = _literal_arguments(node, helper)
+            page = arguments.get(page_arg)
+            if not isinstance(page, str):
+                continue
+            for name_arg in name_args:
+                name = arguments.get(name_arg)
+                if isinstance(name, str) and (page, name) not in LOCATOR_REGISTRY:
+                    missing.append(f"{os.path.relpath(path)}:{node.lineno} {page}/{name}")
+    return missing
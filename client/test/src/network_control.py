@@ -0,0 +1,142 @@
+import json
+from typing import Iterable, List, Optional
+
+# Third-party requests the tests never look at: remote images in the
+# testimonials and footer, web fonts and analytics. Blocked in every browser
+# unless the run uses --no-block-third-party, page metrics included.
+DEFAULT_BLOCKLIST = [
+    "*encrypted-tbn0.gstatic.com*",
+    "*mirrors.creativecommons.org*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+]
+
+# Answers fetch() and XMLHttpRequest (axios) calls whose method and URL path
+# match a stub with its canned JSON instead of sending them. The stubs are
+# substituted as a JSON array of {method, pattern, status, body} and kept in
+# window.__networkStubs. fetch/open/send are only wrapped once per document,
+# the originals stay in window.__networkStubOriginals for RESTORE_SCRIPT, so
+# running the script again just replaces the stubs.
+STUB_SCRIPT = """
+(() => {
+    window.__networkStubs = %s;
+    if (window.__networkStubOriginals) return;
+    const originals = window.__networkStubOriginals = {
+        fetch: window.fetch, open: XMLHttpRequest.prototype.open, send: XMLHttpRequest.prototype.send
+    };
+    const findStub = (method, url) => {
+        const path = new URL(url, location.href).pathname;
+        return (window.__networkStubs || []).find((stub) =>
+            (stub.method === '*' || stub.method === String(method || 'GET').toUpperCase())
+            && new RegExp(stub.pattern).test(path));
+    };
+    window.fetch = function (input, init) {
+        const stub = findStub((init && init.method) || (input && input.method), input.url || String(input));
+        if (!stub) return originals.fetch.apply(this, arguments);
+        return Promise.resolve(new Response(JSON.stringify(stub.body), {
+            status: stub.status, headers: {'Content-Type': 'application/json'}
+        }));
+    };
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__stub = findStub(method, String(url));
+        this.__url = new URL(String(url), location.href).href;
+        return originals.open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        const stub = this.__stub;
+        if (!stub) return originals.send.apply(this, arguments);
+        const text = JSON.stringify(stub.body);
+        Object.defineProperties(this, {
+            readyState: {value: 4, configurable: true},
+            status: {value: stub.status, configurable: true},
+            statusText: {value: stub.status < 400 ? 'OK' : 'Error', configurable: true},
+            responseURL: {value: this.__url, configurable: true},
+            responseText: {value: text, configurable: true},
+            response: {value: this.responseType === 'json' ? stub.body : text, configurable: true},
+        });
+        this.getAllResponseHeaders = () => 'content-type: application/json\\r\\n';
+        this.getResponseHeader = (name) => name.toLowerCase() === 'content-type' ? 'application/json' : null;
+        setTimeout(() => {
+            for (const type of ['readystatechange', 'load', 'loadend']) this.dispatchEvent(new Event(type));
+        }, 0);
+    };
+})();
+"""
+
+# Puts back the fetch/open/send STUB_SCRIPT replaced on the current page
+RESTORE_SCRIPT = """
+const originals = window.__networkStubOriginals;
+if (originals) {
+    window.fetch = originals.fetch;
+    XMLHttpRequest.prototype.open = originals.open;
+    XMLHttpRequest.prototype.send = originals.send;
+    delete window.__networkStubOriginals;
+}
+delete window.__networkStubs;
+"""
+
+
+class NetworkControl:
+    """
+    Controls what one Chrome session loads, through CDP: URL patterns
+    blocked by the browser (Network.setBlockedURLs, '*' wildcards) and
+    canned JSON answers for API routes, installed on every new document.
+    CDP Fetch interception would need an event listener (Fetch.requestPaused),
+    which execute_cdp_cmd can't provide, so the stubs patch fetch and
+    XMLHttpRequest in the page and reset() puts the originals back.
+
+    :param driver:    Selenium WebDriver instance (Chrome).
+    :param blocklist: Patterns that stay blocked after reset().
+    """
+
+    def __init__(self, driver, blocklist: Iterable[str] = ()):
+        self.driver = driver
+        self.default_blocklist: List[str] = list(blocklist)
+        self.blocked: List[str] = []
+        self.stubs: List[dict] = []
+        self._script_id: Optional[str] = None
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self._apply_blocklist()
+
+    def _apply_blocklist(self):
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.default_blocklist + self.blocked})
+
+    def block(self, *patterns: str):
+        """Blocks more URL patterns, e.g. block("*github.com*"), until reset()."""
+        self.blocked.extend(patterns)
+        self._apply_blocklist()
+
+    def stub(self, method: str, pattern: str, body=None, status: int = 200):
+        """
+        Answers `method` requests (or '*' for any) whose URL path matches the
+        regex `pattern` with `body` as JSON, e.g.
+        stub("GET", r"/api/cities$", []).
+        Applies from the next page load on and to the current page.
+        """
+        self.stubs.append({"method": method.upper(), "pattern": pattern, "status": status, "body": body})
+        self._install_stubs()
+
+    def _install_stubs(self):
+        self._remove_stubs()
+        source = STUB_SCRIPT % json.dumps(self.stubs)
+        self._script_id = self.driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": source}
+        )["identifier"]
+        self.driver.execute_script(source)
+
+    def _remove_stubs(self):
+        if self._script_id is not None:
+            self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": self._script_id})
+            self._script_id = None
+
+    def reset(self):
+        """Drops the test's own blocks and stubs, the default blocklist stays."""
+        self.blocked.clear()
+        if self.stubs:
+            self.stubs.clear()
+            self._remove_stubs()
+            # the current page keeps the patched fetch/XHR until it is told otherwise
+            self.driver.execute_script(RESTORE_SCRIPT)
+        self._apply_blocklist()
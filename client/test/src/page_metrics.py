@@ -0,0 +1,112 @@
+import functools
+import json
+import time
+from typing import Callable, Optional
+
+# Page load metrics of the run, one JSON object per measured driver.get()
+PAGE_METRICS_FILE = "page_metrics.jsonl"
+
+# Longest wait for an LCP candidate, only paid on pages with an LCP budget
+LCP_WAIT_MS = 1000
+
+# Reads Navigation Timing, paint timings, transferred bytes and, through
+# buffered PerformanceObservers, Largest Contentful Paint and Cumulative
+# Layout Shift. The SPA renders after the load event, so when there is no
+# LCP candidate yet it polls for one for up to arguments[0] ms (0: no wait).
+COLLECT_METRICS_SCRIPT = """
+const capMs = arguments[0], done = arguments[arguments.length - 1];
+let lcp = null, cls = 0;
+try {
+    new PerformanceObserver((list) => {
+        const entries = list.getEntries();
+        if (entries.length) lcp = entries[entries.length - 1].startTime;
+    }).observe({type: 'largest-contentful-paint', buffered: true});
+} catch (e) {}
+try {
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) if (!entry.hadRecentInput) cls += entry.value;
+    }).observe({type: 'layout-shift', buffered: true});
+} catch (e) {}
+const start = performance.now();
+function report() {
+    if (lcp === null && performance.now() - start < capMs) return setTimeout(report, 50);
+    const nav = performance.getEntriesByType('navigation')[0] || {};
+    const paints = {};
+    for (const paint of performance.getEntriesByType('paint')) paints[paint.name] = paint.startTime;
+    const resources = performance.getEntriesByType('resource');
+    done({
+        url: location.href,
+        ttfb: nav.responseStart,
+        responseEnd: nav.responseEnd,
+        domInteractive: nav.domInteractive,
+        domContentLoaded: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+        firstPaint: paints['first-paint'] ?? null,
+        firstContentfulPaint: paints['first-contentful-paint'] ?? null,
+        largestContentfulPaint: lcp,
+        cumulativeLayoutShift: cls,
+        transferBytes: (nav.transferSize || 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+        resourceCount: resources.length
+    });
+}
+// Buffered observer callbacks arrive as separate tasks
+setTimeout(report, 0);
+"""
+
+
+def collect_page_metrics(driver, lcp_wait_ms: float = 0) -> Optional[dict]:
+    """
+    Returns the load metrics of the page the browser is on (all times in ms
+    from navigation start), or None if they could not be read.
+
+    :param lcp_wait_ms: How long to wait for a Largest Contentful Paint when
+                        the page has none yet. With 0 the metrics are read as
+                        they are, largestContentfulPaint is None before it.
+    """
+    try:
+        return driver.execute_async_script(COLLECT_METRICS_SCRIPT, lcp_wait_ms)
+    except Exception as e:
+        print(f"Warning: Could not collect page metrics: {str(e)}")
+        return None
+
+
+def instrument_page_metrics(driver, on_metrics: Callable[[str, dict], None],
+                            lcp_wait_ms: Callable[[str], Optional[float]] = lambda url: 0):
+    """
+    Wraps driver.get so page visits are followed by collect_page_metrics()
+    and the result is passed to on_metrics(requested_url, metrics).
+
+    :param lcp_wait_ms: requested_url -> LCP wait for collect_page_metrics(),
+                        or None to not collect metrics after that visit.
+    """
+    get = driver.get
+
+    @functools.wraps(get)
+    def get_with_metrics(url):
+        get(url)
+        wait = lcp_wait_ms(url) if url.startswith("http") else None
+        if wait is not None:
+            metrics = collect_page_metrics(driver, wait)
+            if metrics:
+                on_metrics(url, metrics)
+
+    driver.get = get_with_metrics
+    return driver
+
+
+def write_page_metrics(path: str, run_id: str, test: Optional[str], url: str, metrics: dict,
+                       third_party_blocked: bool = True):
+    """
+    Appends one record to page_metrics.jsonl. `third_party_blocked` tells
+    whether the page loaded without the DEFAULT_BLOCKLIST requests, which
+    lowers its LCP and transferred bytes.
+    """
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({
+            "run": run_id,
+            "time": time.time(),
+            "test": test,
+            "url": url,
+            "third_party_blocked": third_party_blocked,
+            "metrics": metrics,
+        }) + "\n")
@@ -0,0 +1,20 @@
+BUDGETS = [
+    {
+        "name": "lcp_landing",
+        "path": "/",
+        "metric": "largestContentfulPaint",
+        "max_ms": 2500
+    },
+    {
+        "name": "cls_landing",
+        "path": "/",
+        "metric": "cumulativeLayoutShift",
+        "max": 0.1,
+        "severity": "warn"
+    },
+    {
+        # button_donate_dialog_1 click -> div_donate_dialog visible
+        "name": "donate_dialog_open",
+        "max_ms": 300
+    },
+]
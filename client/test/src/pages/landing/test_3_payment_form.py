@@ -2,24 +2,13 @@ from time import sleep
 
 import pytest
 import allure
-from src.util import wait_for_element, validate_input,pass_disclaimer
-@allure.step("open payment dialog")
-def open_payment_dialog(driver):
-    """Helper function to open the payment dialog"""
-    driver.get("https://notalonesoldier.com/")
-    pass_disclaimer(driver)
-    donate_button = wait_for_element(driver, "landing", "button_donate_dialog_1")
-    assert donate_button is not None, "❌ Donate button not found"
-    donate_button.click()
-    dialog = wait_for_element(driver, "landing", "div_donate_dialog")
-    assert dialog is not None, "❌ Donate dialog did not appear"
-
+from src.util import wait_for_element, validate_input
+@pytest.mark.start_state("/", dialog="donate")
 @allure.feature("Payment Form Validation")
 class TestPaymentForm:
     
     @allure.story("Card Name Validation")
     def test_card_name_validation(self, driver):
-        open_payment_dialog(driver)
         results = validate_input(
             driver=driver,
             page="landing",
@@ -32,7 +21,6 @@ class TestPaymentForm:
 
     @allure.story("Card Number Validation")
     def test_card_number_validation(self, driver):
-        open_payment_dialog(driver)
         results = validate_input(
             driver=driver,
             page="landing",
@@ -45,7 +33,6 @@ class TestPaymentForm:
 
     @allure.story("Expiry Month Validation")
     def test_expiry_month_validation(self, driver):
-        open_payment_dialog(driver)
         results = validate_input(
             driver=driver,
             page="landing",
@@ -58,7 +45,6 @@ class TestPaymentForm:
 
     @allure.story("Expiry Year Validation")
     def test_expiry_year_validation(self, driver):
-        open_payment_dialog(driver)
         results = validate_input(
             driver=driver,
             page="landing",
@@ -71,7 +57,6 @@ class TestPaymentForm:
 
     @allure.story("CVC Validation")
     def test_cvc_validation(self, driver):
-        open_payment_dialog(driver)
         results = validate_input(
             driver=driver,
             page="landing",
@@ -83,7 +68,6 @@ class TestPaymentForm:
             assert success, error
     @allure.story("Form Card Successful Validation")
     def test_card(self,driver):
-        open_payment_dialog(driver)
         wait_for_element(driver,"landing","input_name_donate_dialog").send_keys("Jone Due")
         wait_for_element(driver,"landing","input_card_number_donate_dialog").send_keys("1234567890123456")
         wait_for_element(driver,"landing","select_expiry_month_donate_dialog").send_keys("1")
@@ -0,0 +1,21 @@
+import allure
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from src.util import wait_for_element, pass_disclaimer
+from src.locator_registry import get_locator
+from src.config import url
+
+
+# Every other test gets the disclaimer dismissed in-page, this one goes through the UI
+@allure.story("disclaimer Validation")
+def test_1_disclaimer(driver, show_disclaimer):
+    driver.get(url("/"))
+    assert wait_for_element(driver, "landing", "Button_disclaimer_just_looking_around") is not None, \
+        "❌ Disclaimer did not appear"
+    pass_disclaimer(driver)
+    WebDriverWait(driver, 5).until(
+        EC.invisibility_of_element_located((By.XPATH, get_locator("landing", "Button_disclaimer_just_looking_around")))
+    )
+    assert wait_for_element(driver, "landing", "button_donate_dialog_1") is not None, "❌ Landing page not usable"
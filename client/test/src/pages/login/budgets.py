@@ -0,0 +1,13 @@
+BUDGETS = [
+    {
+        "name": "lcp_login",
+        "path": "/login",
+        "metric": "largestContentfulPaint",
+        "max_ms": 2500
+    },
+    {
+        # button_sign_in_form click -> browser on /admin/queue
+        "name": "login_submit_to_queue",
+        "max_ms": 1000
+    },
+]
@@ -0,0 +1,27 @@
+import pytest
+
+from src.browser_pool import reset_browser
+from src.config import url
+from src.util import open_authenticated_page, wait_for_element
+
+
+# One login for every test in the profile package
+@pytest.fixture(scope="package")
+def profile_session(driver):
+    open_authenticated_page(driver, "soldier", url("/profile"))
+
+    yield driver
+
+    # Don't leave the shared session driver logged in for the next pages
+    reset_browser(driver)
+
+
+# Every test starts on a freshly loaded profile: the unsaved input, validation errors and
+# selected tab of the previous test are gone, the login stays in sessionStorage
+@pytest.fixture
+def profile_page(profile_session):
+    profile_session.get(url("/profile"))
+    # The form is rendered once the profile has been fetched
+    assert wait_for_element(profile_session, "profile", "input_nickname", timeout=10) is not None, \
+        "❌ Profile page did not load"
+    return profile_session
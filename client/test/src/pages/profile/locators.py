@@ -0,0 +1,54 @@
+LOCATORS = [
+    {
+        "name": "h1_profile_settings",
+        "xpath": "//h1[normalize-space()='Profile Settings']"
+    },
+    {
+        "name": "input_nickname",
+        "xpath": "//input[@id='nickname']"
+    },
+    {
+        "name": "div_nickname_error",
+        "xpath": "//input[@id='nickname']/following-sibling::div[@role='alert']"
+    },
+    {
+        "name": "input_phone",
+        "xpath": "//input[@id='phone']"
+    },
+    {
+        "name": "textarea_bio",
+        "xpath": "//textarea[@id='bio']"
+    },
+    {
+        "name": "img_profile",
+        "xpath": "//img[@alt='Profile']"
+    },
+    {
+        "name": "button_save_changes",
+        "xpath": "//button[normalize-space()='Save Changes']"
+    },
+    {
+        "name": "button_tab_posts",
+        "xpath": "//button[@role='tab'][normalize-space()='Posts']"
+    },
+    {
+        "name": "button_tab_requests",
+        "xpath": "//button[@role='tab'][normalize-space()='My Requests']"
+    },
+    {
+        "name": "button_tab_join_city",
+        "xpath": "//button[@role='tab'][normalize-space()='Join City']"
+    },
+    {
+        "name": "h2_your_posts",
+        "xpath": "//h2[normalize-space()='Your Posts']"
+    },
+    {
+        "name": "h2_donation_requests",
+        "xpath": "//h2[contains(normalize-space(), 'Donation Requests')]"
+    },
+    {
+        "name": "h2_join_city",
+        "xpath": "//h2[normalize-space()='Join a City']"
+    },
+]
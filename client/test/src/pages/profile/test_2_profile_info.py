@@ -1,59 +1,11 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-import time
+import pytest
+import allure
 
-# Set up WebDriver
-driver = webdriver.Chrome()
+from src.util import wait_for_element
 
-try:
-    # 1️⃣ Log in and navigate to Profile Page
-    driver.get("https://notalonesoldier.com/")
-    time.sleep(2)
 
-    # Close Development Notice popup (if present)
-    try:
-        driver.find_element(By.XPATH, "//*[name()='path' and contains(@d,'m6 6 12 12')]").click()
-    except NoSuchElementException:
-        print("⚠️ No Development Notice popup found.")
-
-    # Click on the Login button
-    driver.find_element(By.XPATH, "//button[normalize-space()='Login']").click()
-    time.sleep(2)
-
-    # Enter credentials
-    driver.find_element(By.XPATH, "//input[@id='email']").send_keys("nathan@soldier.com")
-    driver.find_element(By.XPATH, "//input[@id='password']").send_keys("12345678")
-
-    # Click the Sign-in button
-    driver.find_element(By.XPATH, "//button[normalize-space()='Sign in']").click()
-    time.sleep(2)
-
-    # Open sidebar menu and click "Profile"
-    driver.find_element(By.XPATH, "//button[contains(@class, 'top-3 left-4')]").click()
-    time.sleep(2)
-    driver.find_element(By.XPATH, "//a[normalize-space()='Profile']").click()
-    time.sleep(2)
-
-    # 2️⃣ Check if profile information is displayed
-    elements_to_check = {
-        "Nickname": "//input[@id='nickname']",
-        "Phone": "//input[@id='phone']",
-        "Bio": "//textarea[@id='bio']",
-        "Profile Image": "//img[@alt='Profile']"
-    }
-
-    for field, xpath in elements_to_check.items():
-        try:
-            element = driver.find_element(By.XPATH, xpath)
-            assert element.is_displayed(), f"❌ ERROR: {field} is not visible!"
-            print(f"✅ SUCCESS: {field} is displayed correctly!")
-        except NoSuchElementException:
-            print(f"❌ ERROR: {field} not found!")
-
-except Exception as e:
-    print(f"❌ UNEXPECTED ERROR: {str(e)}")
-
-finally:
-    time.sleep(3)
-    driver.quit()  # Close the browser
+@allure.story("Profile information Validation")
+@pytest.mark.parametrize("element_name", ["input_nickname", "input_phone", "textarea_bio", "img_profile"])
+def test_profile_info_displayed(profile_page, element_name):
+    element = wait_for_element(profile_page, "profile", element_name)
+    assert element is not None and element.is_displayed(), f"❌ {element_name} is not visible"
@@ -3,24 +3,17 @@ from time import sleep
 
 import pytest
 import allure
-from src.util import wait_for_element, validate_input, pass_disclaimer, get_admin_login_token, \
-    get_session_storage_value, delete_user
+from src.util import wait_for_element, validate_input, get_session_storage_value
+from src.config import current_path, path_is
 from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import requests
-@allure.step("open signup form")
-def open_signup_form(driver):
-    """Helper function to open the signup form"""
-    driver.get("https://notalonesoldier.com/signup")
-    assert driver.current_url == "https://notalonesoldier.com/signup", "❌ Wrong URL"
-
+@pytest.mark.start_state("/signup")
 @allure.feature("Signup Form Validation")
 class TestSignupForm:
     
     @allure.story("First Name Validation")
     def test_first_name_validation(self, driver):
-        open_signup_form(driver)
         results = validate_input(
             driver=driver,
             page="signup",
@@ -33,7 +26,6 @@ class TestSignupForm:
 
     @allure.story("Last Name Validation")
     def test_last_name_validation(self, driver):
-        open_signup_form(driver)
         results = validate_input(
             driver=driver,
             page="signup",
@@ -46,7 +38,6 @@ class TestSignupForm:
 
     @allure.story("Email Validation")
     def test_email_validation(self, driver):
-        open_signup_form(driver)
         results = validate_input(
             driver=driver,
             page="signup",
@@ -57,9 +48,27 @@ class TestSignupForm:
         for success, error in results:
             assert success, error
 
+    @allure.story("Batched and WebDriver validation agree")
+    def test_batched_validation_matches_webdriver(self, driver):
+        batched = validate_input(
+            driver=driver,
+            page="signup",
+            input_element="input_email_sign_up_form",
+            error_element="p_error_email_sign_up_form",
+            mode="email"
+        )
+        typed = validate_input(
+            driver=driver,
+            page="signup",
+            input_element="input_email_sign_up_form",
+            error_element="p_error_email_sign_up_form",
+            mode="email",
+            batched=False
+        )
+        assert batched == typed, f"❌ Batched results {batched} differ from WebDriver results {typed}"
+
     @allure.story("Password Validation")
     def test_password_validation(self, driver):
-        open_signup_form(driver)
         results = validate_input(
             driver=driver,
             page="signup",
@@ -72,7 +81,6 @@ class TestSignupForm:
 
     @allure.story("Phone Validation")
     def test_phone_validation(self, driver):
-        open_signup_form(driver)
         results = validate_input(
             driver=driver,
             page="signup",
@@ -85,7 +93,6 @@ class TestSignupForm:
 
     @allure.story("Passport Validation")
     def test_passport_validation(self, driver):
-        open_signup_form(driver)
         results = validate_input(
             driver=driver,
             page="signup",
@@ -97,8 +104,7 @@ class TestSignupForm:
             assert success, error
 
     @allure.story("Form Submission Success")
-    def test_successful_signup(self, driver):
-        open_signup_form(driver)
+    def test_successful_signup(self, driver, cleanup):
         
         # Fill in all required fields with valid data
         wait_for_element(driver, "signup", "input_first_name_sign_up_form").send_keys("John")
@@ -118,12 +124,13 @@ class TestSignupForm:
         wait_for_element(driver, "signup", "button_create_account").click()
         
         # Wait for redirect to 2FA setup
-        wait = WebDriverWait(driver, 5)
-        wait.until(EC.url_to_be("https://notalonesoldier.com/2fa"))
-        
-        assert driver.current_url=="https://notalonesoldier.com/2fa", "❌ Failed to redirect to 2FA setup"
-        user = get_session_storage_value(driver, "user")
-        uid=json.loads(user)["_id"]
-        print(user,uid)
-        admin_token=get_admin_login_token()
-        delete_user(admin_token,uid)
+        try:
+            wait = WebDriverWait(driver, 5)
+            wait.until(path_is("/2fa"))
+        finally:
+            # Queue the new account for deletion at session end, even if the redirect failed
+            user = get_session_storage_value(driver, "user")
+            if user:
+                cleanup.add("users", json.loads(user)["_id"])
+
+        assert current_path(driver) == "/2fa", "❌ Failed to redirect to 2FA setup"
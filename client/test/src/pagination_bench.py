@@ -0,0 +1,225 @@
+import argparse
+import csv
+import datetime
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+try:
+    import pymongo
+    from bson import ObjectId
+except ImportError:  # optional, only seeding writes to MongoDB directly
+    pymongo = ObjectId = None
+
+try:
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib import pyplot
+except ImportError:  # optional, the CSV is written either way
+    pyplot = None
+
+from src.api_client import api_url, auth_headers, build_session, get_token
+from src.server_process import add_server_arguments, ensure_channels, target_server
+
+# Channels the seeded messages are spread over, created through the API so the soldier is a member
+BENCH_CHANNEL = "pagination-bench-{index}"
+
+# Documents per insert_many call
+SEED_BATCH = 10_000
+
+# Item offsets (items skipped before the page) and page sizes measured by default
+DEFAULT_OFFSETS = (0, 100, 1_000, 10_000, 50_000, 99_000)
+DEFAULT_LIMITS = (10, 50)
+
+CSV_FIELDS = ["endpoint", "limit", "offset", "page", "samples", "errors", "p50_ms", "min_ms", "max_ms"]
+
+
+def _timestamps(count: int):
+    """One createdAt per document, a second apart and older the further into the seed."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    for index in range(count):
+        yield now - datetime.timedelta(seconds=index)
+
+
+def _insert(collection, documents, total: int, label: str):
+    batch, inserted = [], 0
+    for document in documents:
+        batch.append(document)
+        if len(batch) == SEED_BATCH:
+            collection.insert_many(batch, ordered=False)
+            inserted += len(batch)
+            batch = []
+            print(f"\r{label}: {inserted}/{total}", end="", flush=True)
+    if batch:
+        collection.insert_many(batch, ordered=False)
+        inserted += len(batch)
+    if total:
+        print(f"\r{label}: {inserted}/{total}")
+
+
+def seed(mongodb_uri: str, author_id: str, channel_ids: List[str], posts: int, messages: int):
+    """
+    Tops the database up to `posts` posts and `messages` messages (spread
+    evenly over `channel_ids`) with direct inserts shaped like the mongoose
+    documents, so reruns only insert what is missing.
+    """
+    database = pymongo.MongoClient(mongodb_uri).get_default_database()
+    author = ObjectId(author_id)
+
+    missing_posts = max(0, posts - database.posts.estimated_document_count())
+    _insert(database.posts, (
+        {"authorId": author, "content": f"Pagination benchmark post {index}", "media": [], "likes": [],
+         "createdAt": created, "updatedAt": created, "__v": 0}
+        for index, created in enumerate(_timestamps(missing_posts))
+    ), missing_posts, "posts")
+
+    per_channel = messages // len(channel_ids) if channel_ids else 0
+    for channel_id in channel_ids:
+        channel = ObjectId(channel_id)
+        missing = max(0, per_channel - database.messages.count_documents({"channelId": channel}))
+        _insert(database.messages, (
+            {"channelId": channel, "sender": author, "content": f"Pagination benchmark message {index}",
+             "isEdited": False, "readBy": [author], "createdAt": created, "updatedAt": created, "__v": 0}
+            for index, created in enumerate(_timestamps(missing))
+        ), missing, f"messages {channel_id}")
+
+
+def measure(endpoints: Dict[str, str], limits: List[int], offsets: List[int], samples: int) -> List[dict]:
+    """
+    Times `samples` sequential GETs (after one warm-up call) of every
+    endpoint at every limit and offset, one request at a time so each
+    number is the cost of a single query, not of queueing.
+
+    :param endpoints: name -> API path, called with ?page=&limit=.
+    :return:          One row per point with the CSV_FIELDS.
+    """
+    session = build_session(retries=0)
+    headers = auth_headers(get_token("soldier"))
+    rows = []
+    for name, path in endpoints.items():
+        for limit in limits:
+            for offset in offsets:
+                params = {"page": offset // limit + 1, "limit": limit}
+                session.get(api_url(path), params=params, headers=headers)
+                latencies, errors = [], 0
+                for _ in range(samples):
+                    start = time.perf_counter()
+                    response = session.get(api_url(path), params=params, headers=headers)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    errors += response.status_code >= 400
+                rows.append({
+                    "endpoint": name, "limit": limit, "offset": offset, "page": params["page"],
+                    "samples": samples, "errors": errors, "p50_ms": round(statistics.median(latencies), 2),
+                    "min_ms": round(min(latencies), 2), "max_ms": round(max(latencies), 2),
+                })
+                print(f"{name} limit={limit} offset={offset}: {rows[-1]['p50_ms']} ms")
+    return rows
+
+
+def write_csv(rows: List[dict], path: str):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_csv(path: str) -> List[dict]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return [{**row, "limit": int(row["limit"]), "offset": int(row["offset"]), "p50_ms": float(row["p50_ms"])}
+                for row in csv.DictReader(f)]
+
+
+def write_plot(rows: List[dict], path: str) -> bool:
+    """Median latency against offset, one line per endpoint and limit. False without matplotlib."""
+    if pyplot is None:
+        return False
+    figure, axes = pyplot.subplots(figsize=(9, 5))
+    lines: Dict[tuple, List[dict]] = {}
+    for row in rows:
+        lines.setdefault((row["endpoint"], row["limit"]), []).append(row)
+    for (endpoint, limit), points in sorted(lines.items()):
+        points.sort(key=lambda row: row["offset"])
+        axes.plot([row["offset"] for row in points], [row["p50_ms"] for row in points],
+                  marker="o", label=f"{endpoint} limit={limit}")
+    axes.set_xscale("symlog")
+    axes.set_xlabel("items skipped ((page - 1) * limit)")
+    axes.set_ylabel("median latency (ms)")
+    axes.legend()
+    figure.savefig(path, bbox_inches="tight")
+    pyplot.close(figure)
+    return True
+
+
+def compare(rows: List[dict], baseline: List[dict], max_ratio: float) -> List[str]:
+    """
+    Regression gate: every point measured in both runs whose median got
+    more than `max_ratio` times slower than in the baseline CSV.
+
+    :return: One line per regressed point.
+    """
+    previous = {(row["endpoint"], row["limit"], row["offset"]): row["p50_ms"] for row in baseline}
+    regressions = []
+    for row in rows:
+        before = previous.get((row["endpoint"], row["limit"], row["offset"]))
+        if before and row["p50_ms"] > before * max_ratio:
+            regressions.append(
+                f"{row['endpoint']} limit={row['limit']} offset={row['offset']}: "
+                f"{row['p50_ms']:.1f} ms (baseline {before:.1f} ms)"
+            )
+    return regressions
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",")]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.pagination_bench", description="Latency of deep pages of posts and channel messages."
+    )
+    add_server_arguments(parser)
+    parser.add_argument("--posts", type=int, default=100_000, help="Posts to seed up to.")
+    parser.add_argument("--messages", type=int, default=1_000_000, help="Messages to seed up to, over all channels.")
+    parser.add_argument("--channels", type=int, default=10, help="Channels the messages are spread over.")
+    parser.add_argument("--no-seed", action="store_true", help="Measure the data that is already there.")
+    parser.add_argument("--offsets", type=_int_list, default=list(DEFAULT_OFFSETS), help="Comma-separated.")
+    parser.add_argument("--limits", type=_int_list, default=list(DEFAULT_LIMITS), help="Comma-separated.")
+    parser.add_argument("--samples", type=int, default=5, help="Requests per point.")
+    parser.add_argument("--csv", dest="csv_path", default="pagination.csv")
+    parser.add_argument("--plot", dest="plot_path", default="pagination.png")
+    parser.add_argument("--baseline", help="CSV of an earlier run to compare against.")
+    parser.add_argument("--max-regression", type=float, default=1.5,
+                        help="Fail when a point's median is this many times the baseline's.")
+    args = parser.parse_args(argv)
+
+    if pymongo is None and not args.no_seed:
+        parser.error("pymongo is not installed: pip install -r requirements.txt")
+
+    with target_server(args) as user_ids:
+        names = [BENCH_CHANNEL.format(index=index) for index in range(args.channels)]
+        channel_ids = ensure_channels(names, member_ids=[user_ids["admin"]])
+        bench_channels = [channel_ids[name] for name in names]
+        if not args.no_seed:
+            seed(args.mongodb_uri, user_ids["soldier"], bench_channels, args.posts, args.messages)
+        rows = measure(
+            {"posts": "/posts", "messages": f"/messages/channel/{bench_channels[0]}"},
+            args.limits, args.offsets, args.samples,
+        )
+
+    write_csv(rows, args.csv_path)
+    print(f"Results written to {args.csv_path}")
+    if write_plot(rows, args.plot_path):
+        print(f"Plot written to {args.plot_path}")
+
+    if args.baseline:
+        regressions = compare(rows, read_csv(args.baseline), args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
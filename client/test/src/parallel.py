@@ -0,0 +1,122 @@
+import glob
+import os
+import shutil
+import sys
+from typing import Iterable
+
+# Name used for the single process when pytest-xdist is not active
+MAIN_WORKER = "main"
+
+
+def get_worker_id(config) -> str:
+    """
+    Returns the pytest-xdist worker id ('gw0', 'gw1', ...) of the current
+    process, or MAIN_WORKER when the suite runs in a single process.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return MAIN_WORKER
+    return workerinput["workerid"]
+
+
+def is_worker(config) -> bool:
+    return get_worker_id(config) != MAIN_WORKER
+
+
+def worker_dir(base_dir: str, config) -> str:
+    """
+    Returns (and creates) the output directory for this process.
+    Workers get their own <base_dir>/<worker_id> sub-directory so they never
+    write into the same folder, the single-process run keeps using base_dir.
+    """
+    path = base_dir if not is_worker(config) else os.path.join(base_dir, get_worker_id(config))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def merge_worker_dirs(base_dir: str) -> int:
+    """
+    Moves every file from <base_dir>/gw*/ up into base_dir and removes the
+    emptied worker folders. Allure result files are uuid-named, so the
+    merged folder is a valid allure-results directory.
+
+    :param base_dir: Directory that holds the per-worker sub-directories.
+    :return:         Number of files moved.
+    """
+    if not os.path.isdir(base_dir):
+        return 0
+
+    moved = 0
+    for entry in sorted(os.listdir(base_dir)):
+        sub_dir = os.path.join(base_dir, entry)
+        if not (entry.startswith("gw") and os.path.isdir(sub_dir)):
+            continue
+        for file_name in os.listdir(sub_dir):
+            target = os.path.join(base_dir, file_name)
+            if os.path.exists(target):
+                target = os.path.join(base_dir, f"{entry}_{file_name}")
+            shutil.move(os.path.join(sub_dir, file_name), target)
+            moved += 1
+        shutil.rmtree(sub_dir, ignore_errors=True)
+    return moved
+
+
+def merge_worker_files(path: str):
+    """Appends every per-worker <path>.gwN file to `path` and removes them."""
+    with open(path, "a", encoding="utf-8") as merged:
+        for part in sorted(glob.glob(f"{path}.gw*")):
+            with open(part, encoding="utf-8") as f:
+                merged.write(f.read())
+            os.remove(part)
+
+
+def clear_worker_files(path: str) -> int:
+    """Removes every <path>.gwN file, returns how many there were."""
+    parts = glob.glob(f"{path}.gw*")
+    for part in parts:
+        os.remove(part)
+    return len(parts)
+
+
+def worker_file(path: str, config) -> str:
+    """
+    Returns the file this process appends to: `path` itself for the single
+    process (truncated at start so it only holds this run), <path>.gwN for
+    xdist workers, merged back by merge_worker_files().
+    Called by the controller before its workers start, so the worker files a
+    crashed run left behind are removed instead of merged into this run.
+    """
+    if is_worker(config):
+        return f"{path}.{get_worker_id(config)}"
+    clear_worker_files(path)
+    open(path, "w").close()
+    return path
+
+
+def merge_result_dirs(target_dir: str, source_dirs: Iterable[str]) -> int:
+    """
+    Copies the allure-results of several shards (CI machines) into one
+    directory for a single report. Result and attachment files are
+    uuid-named, so only shared files like environment.properties are
+    overwritten, by the last shard.
+
+    :return: Number of files copied.
+    """
+    os.makedirs(target_dir, exist_ok=True)
+    copied = 0
+    for source_dir in source_dirs:
+        for file_name in os.listdir(source_dir):
+            source = os.path.join(source_dir, file_name)
+            if os.path.isfile(source):
+                shutil.copy2(source, os.path.join(target_dir, file_name))
+                copied += 1
+    return copied
+
+
+if __name__ == "__main__":
+    # python -m src.parallel merge-allure <target dir> <shard results dir>...
+    if len(sys.argv) >= 4 and sys.argv[1] == "merge-allure":
+        print(f"{merge_result_dirs(sys.argv[2], sys.argv[3:])} files merged into {sys.argv[2]}")
+    else:
+        print("usage: python -m src.parallel merge-allure <target dir> <shard results dir>...")
+        sys.exit(2)
@@ -0,0 +1,173 @@
+import importlib
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from src.config import url_path
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+SEVERITIES = ("fail", "warn")
+
+# (page, budget_name) -> budget, filled once per session by load_budgets()
+BUDGET_REGISTRY: Dict[Tuple[str, str], dict] = {}
+
+# Budget checks of the test that is currently running, None between tests
+_current_results: Optional[List[dict]] = None
+
+
+class PerfBudgetError(Exception):
+    """Raised when a budgets.py file declares an invalid budget."""
+
+
+class BudgetExceeded(AssertionError):
+    """The failure of a test that exceeded a 'fail' budget, see failed()."""
+
+
+def _iter_pages(pages_dir: str):
+    for page in sorted(os.listdir(pages_dir)):
+        if os.path.isfile(os.path.join(pages_dir, page, "budgets.py")):
+            yield page
+
+
+def load_budgets(pages_dir: str = PAGES_DIR) -> Dict[Tuple[str, str], dict]:
+    """
+    Imports every pages/<page>/budgets.py once and flattens their BUDGETS
+    lists into a single dict keyed by (page, name).
+
+    A budget is either a page load budget, checked automatically after every
+    driver.get of `path` against one of the collected page metrics:
+        {"name": "lcp_landing", "path": "/", "metric": "largestContentfulPaint", "max_ms": 2500}
+    or an interaction budget, measured by the test with the budget fixture:
+        {"name": "donate_dialog_open", "max_ms": 300}
+    Unitless metrics (cumulativeLayoutShift) use "max" instead of "max_ms".
+    "severity" is 'fail' (default) or 'warn'.
+
+    :raises PerfBudgetError: On an entry without a name or limit, an unknown
+                             severity or a name declared twice on a page.
+    """
+    registry: Dict[Tuple[str, str], dict] = {}
+    errors: List[str] = []
+
+    for page in _iter_pages(pages_dir):
+        budgets_module = importlib.import_module(f"src.pages.{page}.budgets")
+        for index, budget in enumerate(getattr(budgets_module, "BUDGETS", [])):
+            name = budget.get("name")
+            limit = budget.get("max_ms", budget.get("max"))
+            if not name or not isinstance(limit, (int, float)):
+                errors.append(f"{page}/budgets.py entry #{index} is missing a name or max_ms/max")
+                continue
+            if budget.get("severity", "fail") not in SEVERITIES:
+                errors.append(f"{page}/budgets.py '{name}' has an unknown severity")
+                continue
+            if ("path" in budget) != ("metric" in budget):
+                errors.append(f"{page}/budgets.py '{name}' needs both a path and a metric, or neither")
+                continue
+            if (page, name) in registry:
+                errors.append(f"{page}/budgets.py declares '{name}' more than once")
+                continue
+            registry[(page, name)] = {
+                **budget,
+                "page": page,
+                "limit": limit,
+                "unit": "ms" if "max_ms" in budget else "",
+                "severity": budget.get("severity", "fail"),
+            }
+
+    if errors:
+        raise PerfBudgetError("\n".join(errors))
+
+    BUDGET_REGISTRY.clear()
+    BUDGET_REGISTRY.update(registry)
+    return BUDGET_REGISTRY
+
+
+def get_budget(page: str, name: str) -> dict:
+    """
+    Returns the budget registered for (page, name).
+    Loads the registry lazily when used outside a pytest session.
+    """
+    if not BUDGET_REGISTRY:
+        load_budgets()
+    try:
+        return BUDGET_REGISTRY[(page, name)]
+    except KeyError:
+        raise PerfBudgetError(f"No budget '{name}' in {page}/budgets.py") from None
+
+
+def page_budgets(page_url: str) -> List[dict]:
+    """Returns the page load budgets whose path matches the path of `page_url`."""
+    if not BUDGET_REGISTRY:
+        load_budgets()
+    path = url_path(page_url)
+    return [budget for budget in BUDGET_REGISTRY.values() if budget.get("path") == path]
+
+
+def start_recording():
+    global _current_results
+    _current_results = []
+
+
+def stop_recording() -> List[dict]:
+    global _current_results
+    results, _current_results = _current_results or [], None
+    return results
+
+
+def recorded() -> List[dict]:
+    """The checks of the running test so far."""
+    return list(_current_results or [])
+
+
+def failed(results: List[dict]) -> List[dict]:
+    """The exceeded budgets among `results` that fail their test."""
+    return [result for result in results if not result["passed"] and result["severity"] == "fail"]
+
+
+def check(budget: dict, value: float, mode: str = "fail") -> dict:
+    """
+    Compares `value` with the budget and records the result for the running
+    test. Nothing is raised here: a page load check runs inside driver.get,
+    often in a fixture, so exceeded 'fail' budgets fail the test once its
+    call has finished (see failed()).
+
+    :param budget: Entry from the registry (get_budget / page_budgets).
+    :param value:  Measured value, in ms for timing budgets.
+    :param mode:   --perf-budgets: 'fail' keeps each budget's severity,
+                   'warn' never fails.
+    :return:       The result: page, name, value, limit, unit, severity, passed.
+    """
+    result = {
+        "page": budget["page"],
+        "name": budget["name"],
+        "value": value,
+        "limit": budget["limit"],
+        "unit": budget["unit"],
+        "severity": budget["severity"] if mode == "fail" else "warn",
+        "passed": value <= budget["limit"],
+    }
+    if _current_results is not None:
+        _current_results.append(result)
+    return result
+
+
+@contextmanager
+def measure(budget: dict, mode: str = "fail"):
+    """Times the enclosed block in ms and checks it against the budget."""
+    start = time.perf_counter()
+    yield
+    check(budget, (time.perf_counter() - start) * 1000, mode)
+
+
+def format_result(result: dict) -> str:
+    status = "ok" if result["passed"] else ("FAIL" if result["severity"] == "fail" else "WARN")
+    unit = f" {result['unit']}" if result["unit"] else ""
+    value = f"{result['value']:.1f}" if result["unit"] else f"{result['value']:.3f}"
+    return f"{result['page']}/{result['name']}: {value}{unit} (budget {result['limit']}{unit}) {status}"
+
+
+def format_report(results: List[dict]) -> str:
+    """One line per check, exceeded budgets first."""
+    ordered = sorted(results, key=lambda result: (result["passed"], result["page"], result["name"]))
+    return "\n".join(format_result(result) for result in ordered)
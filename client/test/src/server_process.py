@@ -0,0 +1,271 @@
+import argparse
+import os
+import socket
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+from src.api_client import SESSION, TEST_USERS, USER_TYPES, api_url, auth_headers, get_token
+from src.config import CONFIG
+
+# The Express API, started with ts-node from its own folder (it reads ./https from there)
+SERVER_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "Server"
+)
+
+# Output of the started server, next to the other run outputs
+SERVER_LOG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "server.log")
+
+# Secrets validateEnv() requires under NODE_ENV=test, used when neither the environment nor
+# Server/.env sets them. Fixed values: PASSWORD_KEY peppers the stored passwords, so it has
+# to stay the same for the accounts seeded in earlier runs to keep logging in.
+SERVER_ENV_DEFAULTS = {
+    "JWT_SECRET": "not-alone-load-jwt",
+    "PASSWORD_KEY": "not-alone-load-pepper",
+}
+
+# Local database the started server uses, kept between runs
+MONGODB_URI = os.environ.get("LOAD_MONGODB_URI", "mongodb://127.0.0.1:27017/not-alone-load")
+
+# City the benchmarks create requests in and join sockets to, found by the admin's membership
+LOAD_CITY = {"name": "Load Test City", "zone": "north", "bio": "City used by the API load tests"}
+
+# Registration details of the TEST_USERS accounts on a fresh database
+SEED_PROFILES = {
+    role: {"type": USER_TYPES[role], "firstName": "Load", "lastName": USER_TYPES[role],
+           "phone": f"+97250000000{index}", "passport": f"90000000{index}"}
+    for index, role in enumerate(TEST_USERS, start=1)
+}
+
+# Error of the register call for an email that has an account, which seeding reuses
+ALREADY_REGISTERED = "Email already registered"
+
+# Password of the accounts seed_accounts() registers
+SEED_PASSWORD = "12345678a"
+
+
+def _dotenv_keys() -> set:
+    path = os.path.join(SERVER_DIR, ".env")
+    if not os.path.isfile(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {line.split("=", 1)[0].strip() for line in f if "=" in line and not line.lstrip().startswith("#")}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class ServerProcess:
+    """
+    Runs the real Express server (Server/src/index.ts through ts-node) on a
+    local port against a local MongoDB. NODE_ENV=test selects
+    MONGODB_URI_TEST and the test limits of the rate limiters in
+    middleware/security.ts, so load runs measure the API, not the limiters.
+
+    :param port:        0 picks a free port.
+    :param mongodb_uri: Database the server connects to.
+    :param log_path:    File the server's stdout and stderr go to.
+    """
+
+    def __init__(self, port: int = 0, mongodb_uri: str = MONGODB_URI, log_path: Optional[str] = None,
+                 startup_timeout: float = 120):
+        self.port = port or free_port()
+        self.mongodb_uri = mongodb_uri
+        self.log_path = log_path or SERVER_LOG
+        self.startup_timeout = startup_timeout
+        self.process: Optional[subprocess.Popen] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "ServerProcess":
+        env = {
+            **os.environ,
+            "NODE_ENV": "test",
+            "PORT": str(self.port),
+            "MONGODB_URI_TEST": self.mongodb_uri,
+        }
+        configured = _dotenv_keys()
+        for key, value in SERVER_ENV_DEFAULTS.items():
+            if key not in env and key not in configured:
+                env[key] = value
+        with open(self.log_path, "w") as log:
+            self.process = subprocess.Popen(
+                ["npx", "ts-node", "src/index.ts"], cwd=os.path.abspath(SERVER_DIR), env=env,
+                stdout=log, stderr=subprocess.STDOUT
+            )
+        self._wait_until_ready()
+        return self
+
+    def _wait_until_ready(self):
+        deadline = time.time() + self.startup_timeout
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {self.process.returncode}, see {self.log_path}")
+            try:
+                # Any answer means Express is listening, it only listens once MongoDB is connected
+                requests.get(f"{self.base_url}/api/cities", timeout=1)
+                return
+            except requests.RequestException:
+                time.sleep(0.5)
+        self.stop()
+        raise RuntimeError(f"Server did not start within {self.startup_timeout}s, see {self.log_path}")
+
+    def stop(self):
+        if self.process is None or self.process.poll() is not None:
+            return
+        # SIGTERM closes the server and the MongoDB connection gracefully
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+def _already_registered(response: requests.Response) -> bool:
+    """The 400 of controllers/userController.ts registerUser for an existing email."""
+    if response.status_code != 400:
+        return False
+    try:
+        return response.json().get("error") == ALREADY_REGISTERED
+    except ValueError:
+        return False
+
+
+def _seed_account(body: dict) -> dict:
+    """
+    Registers `body` unless its email already is, approves the account as the
+    admin when it is still pending, and logs it in.
+
+    :return: The login response: {"token", "user", ...}.
+    """
+    credentials = {"email": body["email"], "password": body["password"]}
+    response = SESSION.post(api_url("/auth/register"), json=body)
+    if response.status_code != 201 and not _already_registered(response):
+        # validation failures are 400s too, show which field the profile got wrong
+        raise requests.HTTPError(
+            f"Registering {body['email']} failed: HTTP {response.status_code} {response.text}", response=response
+        )
+
+    login = SESSION.post(api_url("/auth/login"), json=credentials)
+    login.raise_for_status()
+    data = login.json()
+    if data.get("status") == "pending":
+        approve = SESSION.post(
+            api_url(f"/users/approve/{data['user']['_id']}"), headers=auth_headers(get_token("admin"))
+        )
+        approve.raise_for_status()
+        # a pending login answers without a token
+        login = SESSION.post(api_url("/auth/login"), json=credentials)
+        login.raise_for_status()
+        data = login.json()
+    return data
+
+
+def seed_users(profiles: Dict[str, dict] = SEED_PROFILES) -> Dict[str, str]:
+    """
+    Makes sure every TEST_USERS account exists and is approved on the
+    configured API: registers the admin (approved on registration under
+    NODE_ENV=test), then the other accounts, and approves them as the admin.
+    Accounts that already exist are left as they are.
+
+    :return: role -> user id.
+    """
+    user_ids = {}
+    roles = sorted(profiles, key=lambda role: profiles[role]["type"] != "Admin")
+    for role in roles:
+        body = {**profiles[role], **TEST_USERS[role]}
+        if body["type"] == "Admin":
+            body["approvalStatus"] = "approved"
+        user_ids[role] = _seed_account(body)["user"]["_id"]
+    return user_ids
+
+
+def seed_accounts(count: int, user_type: str = "Soldier", prefix: str = "load-soldier",
+                  workers: int = 16) -> List[dict]:
+    """
+    Like seed_users(), for `count` numbered accounts of `user_type`
+    ({prefix}-{index}@not-alone.test, SEED_PASSWORD), registered and logged
+    in `workers` at a time. Reruns log the existing accounts in.
+
+    :return: One {"_id", "token"} per account, in index order.
+    """
+    def seed(index: int) -> dict:
+        data = _seed_account({
+            "email": f"{prefix}-{index}@not-alone.test", "password": SEED_PASSWORD, "type": user_type,
+            "firstName": "Load", "lastName": user_type,
+            # outside the SEED_PROFILES numbers, unique per index
+            "phone": f"+9725{10_000_000 + index:08d}", "passport": f"8{index:08d}",
+        })
+        return {"_id": data["user"]["_id"], "token": data["token"]}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="seed-accounts") as executor:
+        return list(executor.map(seed, range(count)))
+
+
+def ensure_city(city: dict = LOAD_CITY) -> str:
+    """Returns the id of the admin's city, creating `city` when the admin has none yet."""
+    headers = auth_headers(get_token("admin"))
+    cities = SESSION.get(api_url("/cities/me"), headers=headers)
+    cities.raise_for_status()
+    if cities.json():
+        return cities.json()[0]["_id"]
+    created = SESSION.post(api_url("/cities"), json=city, headers=headers)
+    created.raise_for_status()
+    return created.json()["_id"]
+
+
+def ensure_channels(names: Iterable[str], role: str = "soldier", member_ids: Iterable[str] = ()) -> Dict[str, str]:
+    """
+    Returns name -> id of group channels of `role`, creating the missing ones
+    with `member_ids` (a group needs a second member besides the creator).
+    """
+    headers = auth_headers(get_token(role))
+    channels = SESSION.get(api_url("/channels"), headers=headers)
+    channels.raise_for_status()
+    ids = {channel["name"]: channel["_id"] for channel in channels.json() if channel.get("name")}
+    for name in names:
+        if name not in ids:
+            created = SESSION.post(api_url("/channels"), headers=headers, json={
+                "name": name, "type": "group", "members": list(member_ids), "isPublic": False
+            })
+            created.raise_for_status()
+            ids[name] = created.json()["_id"]
+    return ids
+
+
+def add_server_arguments(parser: argparse.ArgumentParser, required: bool = True):
+    """--start-server / --base-url, shared by the load and benchmark command lines."""
+    target = parser.add_mutually_exclusive_group(required=required)
+    target.add_argument("--start-server", action="store_true",
+                        help="Start Server/ with NODE_ENV=test against LOAD_MONGODB_URI.")
+    target.add_argument("--base-url", help="Already running server, started with NODE_ENV=test.")
+    parser.add_argument("--mongodb-uri", default=MONGODB_URI,
+                        help="Local MongoDB of the server under test (LOAD_MONGODB_URI).")
+
+
+@contextmanager
+def target_server(args: argparse.Namespace):
+    """
+    Points the API helpers at the server chosen by add_server_arguments(),
+    starting (and afterwards stopping) it for --start-server, and makes sure
+    the test accounts exist on it.
+
+    :return: role -> user id, from seed_users().
+    """
+    server = ServerProcess(mongodb_uri=args.mongodb_uri).start() if args.start_server else None
+    CONFIG.base_url = server.base_url if server else args.base_url
+    try:
+        yield seed_users()
+    finally:
+        if server:
+            server.stop()
@@ -0,0 +1,258 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional, Set
+
+try:
+    import socketio
+except ImportError:  # optional, only this benchmark talks to the socket server
+    socketio = None
+
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
+
+from src.api_load import PERCENTILES, percentile
+from src.config import CONFIG
+from src.server_process import add_server_arguments, ensure_channels, ensure_city, seed_accounts, target_server
+
+# Socket.IO is mounted under the API prefix (services/socketService.ts)
+SOCKET_PATH = "/api/socket.io"
+
+# Channels the clients are spread over, created once and reused by name
+FANOUT_CHANNEL = "load-fanout-{index}"
+
+# Upper bounds (ms) of the delivery latency histogram buckets, the last one catches the rest
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float("inf"))
+
+
+class FanoutStats:
+    """
+    Bookkeeping of one run. Every message carries the run id and a sequence
+    number in its content, so each receiver can tell which send it belongs
+    to, how long it took and whether it already got it.
+    """
+
+    def __init__(self):
+        self.run_id = uuid.uuid4().hex[:8]
+        # seq -> (send time, receivers in the channel when it was sent)
+        self.sent: Dict[int, tuple] = {}
+        self.delivered: Dict[int, int] = {}
+        self.duplicates = 0
+        self.latencies_ms: List[float] = []
+        self.connect_ms: List[float] = []
+        self.connect_failures: Dict[str, int] = {}
+        self.server_errors: Dict[str, int] = {}
+
+    def content(self, seq: int) -> str:
+        return f"bench:{self.run_id}:{seq}"
+
+    def parse(self, content) -> Optional[int]:
+        prefix = f"bench:{self.run_id}:"
+        if isinstance(content, str) and content.startswith(prefix):
+            return int(content[len(prefix):])
+        return None
+
+    def summary(self) -> dict:
+        expected = sum(receivers for _, receivers in self.sent.values())
+        delivered = sum(self.delivered.values())
+        latencies = sorted(self.latencies_ms)
+        connect = sorted(self.connect_ms)
+        histogram, previous = {}, 0.0
+        for bound in HISTOGRAM_BUCKETS_MS:
+            label = f"<= {bound:g} ms" if bound != float("inf") else f"> {previous:g} ms"
+            histogram[label] = sum(1 for latency in latencies if previous < latency <= bound)
+            previous = bound
+        return {
+            "connected": len(connect),
+            "connect_failures": self.connect_failures,
+            **{f"connect_p{pct}_ms": percentile(connect, pct) for pct in PERCENTILES},
+            "messages_sent": len(self.sent),
+            "deliveries_expected": expected,
+            "deliveries": delivered,
+            "dropped": expected - delivered,
+            "duplicates": self.duplicates,
+            **{f"p{pct}_ms": percentile(latencies, pct) for pct in PERCENTILES},
+            "histogram": histogram,
+            "server_errors": self.server_errors,
+        }
+
+
+class BenchClient:
+    """
+    One socket of its own account in one channel and the load city. The
+    channel is joined through the channelId handshake query, which the server
+    handles before it emits 'authenticated', so the room is set once connect()
+    returns. The server keeps one connection per user id, so sockets sharing
+    an account would overwrite each other's entry.
+    """
+
+    def __init__(self, stats: FanoutStats, account: dict, channel_id: str, city_id: str):
+        self.stats = stats
+        self.user_id = account["_id"]
+        self.token = account["token"]
+        self.channel_id = channel_id
+        self.city_id = city_id
+        self.received: Set[int] = set()
+        self.connected = False
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self._authenticated = asyncio.Event()
+        self.sio.on("authenticated", self._authenticated.set)
+        self.sio.on("message received", self.on_message)
+        self.sio.on("error", self.on_error)
+
+    async def connect(self, timeout: float):
+        start = time.perf_counter()
+        try:
+            await self.sio.connect(
+                f"{CONFIG.base_url}?channelId={self.channel_id}", socketio_path=SOCKET_PATH,
+                transports=["websocket"], auth={"token": self.token}, wait_timeout=timeout
+            )
+            await asyncio.wait_for(self._authenticated.wait(), timeout)
+            await self.sio.emit("join_city", self.city_id)
+        except Exception as e:
+            kind = type(e).__name__
+            self.stats.connect_failures[kind] = self.stats.connect_failures.get(kind, 0) + 1
+            return
+        self.connected = True
+        self.stats.connect_ms.append((time.perf_counter() - start) * 1000)
+
+    async def send(self, seq: int):
+        await self.sio.emit("new message", {
+            "channelId": self.channel_id, "content": self.stats.content(seq), "sender": self.user_id,
+        })
+
+    def on_message(self, message: dict):
+        seq = self.stats.parse(message.get("content"))
+        if seq is None or seq not in self.stats.sent:
+            return
+        if seq in self.received:
+            self.stats.duplicates += 1
+            return
+        self.received.add(seq)
+        self.stats.delivered[seq] = self.stats.delivered.get(seq, 0) + 1
+        self.stats.latencies_ms.append((time.perf_counter() - self.stats.sent[seq][0]) * 1000)
+
+    def on_error(self, data):
+        message = data.get("message") if isinstance(data, dict) else str(data)
+        self.stats.server_errors[message] = self.stats.server_errors.get(message, 0) + 1
+
+    async def disconnect(self):
+        if self.sio.connected:
+            await self.sio.disconnect()
+
+
+def raise_open_files_limit():
+    """Thousands of sockets need as many file descriptors, lift the soft limit to the hard one."""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def run_fanout(clients: List[BenchClient], rate: float, duration: float,
+                     connect_concurrency: int, connect_timeout: float, drain: float,
+                     stats: FanoutStats) -> float:
+    """
+    Connects every client (at most `connect_concurrency` handshakes at a
+    time), then sends `rate` messages per second for `duration` seconds,
+    round-robin over the channels, each from a connected client of that
+    channel. Waits `drain` seconds for late deliveries before disconnecting.
+
+    :return: Seconds spent sending.
+    """
+    semaphore = asyncio.Semaphore(connect_concurrency)
+
+    async def connect(client: BenchClient):
+        async with semaphore:
+            await client.connect(connect_timeout)
+
+    await asyncio.gather(*(connect(client) for client in clients))
+
+    by_channel: Dict[str, List[BenchClient]] = {}
+    for client in clients:
+        if client.connected:
+            by_channel.setdefault(client.channel_id, []).append(client)
+    channels = sorted(by_channel)
+
+    start = time.perf_counter()
+    sends = []
+    for seq in range(int(rate * duration) if channels else 0):
+        await asyncio.sleep(max(0.0, start + seq / rate - time.perf_counter()))
+        members = by_channel[channels[seq % len(channels)]]
+        stats.sent[seq] = (time.perf_counter(), len(members))
+        sends.append(asyncio.ensure_future(members[seq // len(channels) % len(members)].send(seq)))
+    await asyncio.gather(*sends, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    await asyncio.sleep(drain)
+    await asyncio.gather(*(client.disconnect() for client in clients), return_exceptions=True)
+    return elapsed
+
+
+def format_summary(summary: dict, clients: int, channels: int, elapsed: float) -> str:
+    lines = [
+        f"{summary['connected']}/{clients} clients connected over {channels} channels "
+        f"(connect p50 {summary['connect_p50_ms']:.0f} ms, p99 {summary['connect_p99_ms']:.0f} ms)",
+        f"{summary['messages_sent']} messages in {elapsed:.1f}s, "
+        f"{summary['deliveries']}/{summary['deliveries_expected']} deliveries, "
+        f"{summary['dropped']} dropped, {summary['duplicates']} duplicated",
+        "delivery latency: " + ", ".join(f"p{pct} {summary[f'p{pct}_ms']:.1f} ms" for pct in PERCENTILES),
+    ]
+    lines += [f"    {label:>12}: {count}" for label, count in summary["histogram"].items()]
+    for kind, count in sorted({**summary["connect_failures"], **summary["server_errors"]}.items()):
+        lines.append(f"error {kind}: {count}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.socket_bench", description="Socket.IO channel fan-out benchmark."
+    )
+    parser.add_argument("--clients", type=int, default=1000, help="Concurrent sockets.")
+    parser.add_argument("--channels", type=int, default=10, help="Channels the sockets are spread over.")
+    parser.add_argument("--rate", type=float, default=10, help="Messages sent per second, over all channels.")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to send messages for.")
+    parser.add_argument("--connect-concurrency", type=int, default=100, help="Handshakes in flight at most.")
+    parser.add_argument("--connect-timeout", type=float, default=20)
+    parser.add_argument("--drain", type=float, default=5, help="Seconds to wait for late deliveries.")
+    add_server_arguments(parser)
+    parser.add_argument("--json", dest="json_path", help="Also write the summary to this JSON file.")
+    args = parser.parse_args(argv)
+
+    if socketio is None:
+        parser.error("python-socketio is not installed: pip install -r requirements.txt")
+    raise_open_files_limit()
+
+    with target_server(args) as user_ids:
+        names = [FANOUT_CHANNEL.format(index=index) for index in range(args.channels)]
+        channel_ids = ensure_channels(names, member_ids=[user_ids["admin"]])
+        city_id = ensure_city()
+        accounts = seed_accounts(args.clients)
+
+        async def run():
+            stats = FanoutStats()
+            clients = [BenchClient(stats, account, channel_ids[names[index % len(names)]], city_id)
+                       for index, account in enumerate(accounts)]
+            elapsed = await run_fanout(clients, args.rate, args.duration,
+                                       args.connect_concurrency, args.connect_timeout, args.drain, stats)
+            return stats, elapsed
+
+        stats, elapsed = asyncio.run(run())
+
+    summary = stats.summary()
+    print(format_summary(summary, args.clients, args.channels, elapsed))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"clients": args.clients, "channels": args.channels, "rate": args.rate,
+                       "elapsed": elapsed, "summary": summary}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
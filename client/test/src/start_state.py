@@ -0,0 +1,111 @@
+from typing import Dict, List, NamedTuple, Optional
+
+import allure
+
+from src.config import url
+from src.timings import timed
+from src.util import wait_for_element, wait_for_disclaimer, open_authenticated_page
+
+# Marker declaring where a test starts, e.g. @pytest.mark.start_state("/", dialog="donate")
+MARKER = "start_state"
+
+# Extra steps after loading a page before it is usable
+PAGE_SETUP = {
+    "/": wait_for_disclaimer,
+}
+
+# dialog name -> (page, trigger locator, dialog locator)
+DIALOGS = {
+    "donate": ("landing", "button_donate_dialog_1", "div_donate_dialog"),
+}
+
+# Describes the page the browser is on. window.__startState is set once a
+# start state is reached, so it only survives while the document is the
+# same one (any reload or driver.get clears it).
+READ_STATE_SCRIPT = """
+const fields = document.querySelectorAll(
+    'input:not([type=hidden]):not([type=checkbox]):not([type=radio]), textarea');
+return {
+    key: window.__startState || null,
+    path: location.pathname,
+    loggedIn: !!sessionStorage.getItem('token'),
+    dialogOpen: !!document.querySelector('[role="dialog"], [role="alertdialog"]'),
+    pristine: Array.from(fields).every((field) => !field.value)
+};
+"""
+
+
+class StartState(NamedTuple):
+    path: str
+    role: Optional[str] = None
+    dialog: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.role or ''}|{self.path}|{self.dialog or ''}"
+
+
+def get_start_state(item) -> Optional[StartState]:
+    """Returns the start state declared on a test (or its class/module), or None."""
+    marker = item.get_closest_marker(MARKER)
+    if marker is None:
+        return None
+    return StartState(*marker.args, **marker.kwargs)
+
+
+def schedule(items: List) -> List:
+    """
+    Reorders tests so the ones with the same declared start state run back
+    to back, each group where its first test was. Tests without a start
+    state keep their place, and the order inside a group doesn't change.
+    """
+    groups: Dict[object, List] = {}
+    for index, item in enumerate(items):
+        state = get_start_state(item)
+        groups.setdefault(state if state is not None else index, []).append(item)
+    return [item for group in groups.values() for item in group]
+
+
+def matches(driver, state: StartState) -> bool:
+    """
+    True if the browser is still on the untouched document that was set up
+    for `state`: same path, login and dialog, and no form field filled in.
+    """
+    try:
+        current = driver.execute_script(READ_STATE_SCRIPT)
+    except Exception:
+        return False
+    return (
+        current["key"] == state.key
+        and current["path"] == state.path
+        and current["loggedIn"] == (state.role is not None)
+        and current["dialogOpen"] == (state.dialog is not None)
+        and current["pristine"]
+    )
+
+
+@timed
+@allure.step("Start on {state}")
+def open_start_state(driver, state: StartState) -> bool:
+    """
+    Brings the browser to `state`, reusing the current page when it already
+    matches and navigating only when it doesn't.
+
+    :return: True if the current page was reused.
+    """
+    if matches(driver, state):
+        return True
+
+    if state.role:
+        open_authenticated_page(driver, state.role, url(state.path))
+    else:
+        driver.get(url(state.path))
+    setup = PAGE_SETUP.get(state.path)
+    if setup:
+        setup(driver)
+    if state.dialog:
+        page, trigger, dialog = DIALOGS[state.dialog]
+        wait_for_element(driver, page, trigger).click()
+        assert wait_for_element(driver, page, dialog) is not None, f"❌ {state.dialog} dialog did not appear"
+    driver.execute_script("window.__startState = arguments[0];", state.key)
+    return False
@@ -0,0 +1,84 @@
+import functools
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Machine-readable per-test timings of the run, one JSON object per line
+TIMINGS_FILE = "timings.jsonl"
+
+# Steps recorded for the test that is currently running, None between tests
+_current_steps: Optional[List[dict]] = None
+
+
+def start_recording():
+    global _current_steps
+    _current_steps = []
+
+
+def stop_recording() -> List[dict]:
+    global _current_steps
+    steps, _current_steps = _current_steps or [], None
+    return steps
+
+
+def record(name: str, kind: str, seconds: float):
+    if _current_steps is not None:
+        _current_steps.append({"name": name, "kind": kind, "seconds": seconds})
+
+
+@contextmanager
+def timing(name: str, kind: str = "helper"):
+    """Times the enclosed block and records it for the running test."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, kind, time.perf_counter() - start)
+
+
+def timed(func):
+    """Decorator recording every call of a util helper under its function name."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with timing(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def instrument_driver(driver):
+    """
+    Times every WebDriver command of `driver` (and of its elements, which go
+    through the same execute()), recorded as kind 'webdriver'.
+    """
+    execute = driver.execute
+
+    @functools.wraps(execute)
+    def timed_execute(driver_command, params=None):
+        with timing(driver_command, "webdriver"):
+            return execute(driver_command, params)
+
+    driver.execute = timed_execute
+    return driver
+
+
+def summarize(steps: List[dict]) -> Dict[str, dict]:
+    """Groups steps by kind:name with call count and total seconds, slowest first."""
+    summary: Dict[str, dict] = {}
+    for step in steps:
+        entry = summary.setdefault(f"{step['kind']}:{step['name']}", {"count": 0, "seconds": 0.0})
+        entry["count"] += 1
+        entry["seconds"] += step["seconds"]
+    return dict(sorted(summary.items(), key=lambda item: item[1]["seconds"], reverse=True))
+
+
+def format_summary(summary: Dict[str, dict]) -> str:
+    lines = [f"{'step':<50} {'calls':>5} {'total ms':>10}"]
+    for name, entry in summary.items():
+        lines.append(f"{name:<50} {entry['count']:>5} {entry['seconds'] * 1000:>10.1f}")
+    return "\n".join(lines)
+
+
+def write_timings(path: str, entry: dict):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
@@ -0,0 +1,77 @@
+import base64
+import json
+import time
+
+import pytest
+
+from src import api_client
+from src.api_client import TOKEN_EXPIRY_MARGIN, api_login, get_token, get_token_expiry
+
+
+def make_jwt(claims: dict) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+@pytest.fixture
+def logins(monkeypatch):
+    """Replaces the login call, the test sets the 'exp' of the next tokens it hands out."""
+    calls = []
+    state = {"exp": None}
+
+    def post(url, **kwargs):
+        email = kwargs["json"]["email"]
+        calls.append(email)
+        claims = {"id": len(calls)} if state["exp"] is None else {"id": len(calls), "exp": state["exp"]}
+        return FakeResponse({"token": make_jwt(claims), "user": {"email": email}})
+
+    monkeypatch.setattr(api_client, "_TOKEN_CACHE", {})
+    monkeypatch.setattr(api_client.SESSION, "post", post)
+    return calls, state
+
+
+def test_get_token_expiry():
+    assert get_token_expiry(make_jwt({"exp": 1700000000})) == 1700000000
+    assert get_token_expiry(make_jwt({"id": "1"})) is None
+    assert get_token_expiry("not a jwt") is None
+
+
+def test_token_is_cached_per_role_until_it_expires(logins):
+    calls, state = logins
+    state["exp"] = time.time() + 3600
+
+    assert get_token("soldier") == get_token("soldier")
+    get_token("admin")
+
+    assert len(calls) == 2
+
+
+def test_token_within_the_expiry_margin_is_renewed(logins):
+    calls, state = logins
+    state["exp"] = time.time() + TOKEN_EXPIRY_MARGIN / 2
+
+    first = get_token("soldier")
+    second = get_token("soldier")
+
+    assert first != second
+    assert len(calls) == 2
+
+
+def test_token_without_expiry_is_kept(logins):
+    calls, _ = logins
+
+    api_login("soldier")
+    api_login("soldier")
+
+    assert len(calls) == 1
@@ -0,0 +1,77 @@
+import os
+
+from src.artifacts import ALLURE_ATTACHMENT_GLOB, ArtifactWriter, prune_directory
+from src.parallel import merge_worker_dirs
+
+
+def write_files(directory, sizes):
+    """One file per size, each a second older than the next."""
+    for index, size in enumerate(sizes):
+        path = directory / f"file_{index}"
+        path.write_bytes(b"x" * size)
+        os.utime(path, (1000 + index, 1000 + index))
+
+
+def remaining(directory):
+    return sorted(path.name for path in directory.iterdir())
+
+
+def test_prune_directory_keeps_the_newest_files(tmp_path):
+    write_files(tmp_path, [10, 10, 10, 10])
+    assert prune_directory(str(tmp_path), max_files=2, max_bytes=1000) == 2
+    assert remaining(tmp_path) == ["file_2", "file_3"]
+
+
+def test_prune_directory_by_size(tmp_path):
+    write_files(tmp_path, [100, 100, 50, 10])
+    assert prune_directory(str(tmp_path), max_files=10, max_bytes=100) == 2
+    assert remaining(tmp_path) == ["file_2", "file_3"]
+
+
+def test_prune_directory_ignores_sub_directories(tmp_path):
+    write_files(tmp_path, [10, 10])
+    (tmp_path / "gw0").mkdir()
+    assert prune_directory(str(tmp_path), max_files=1, max_bytes=1000) == 1
+    assert remaining(tmp_path) == ["file_1", "gw0"]
+
+
+def test_prune_directory_only_counts_matching_files(tmp_path):
+    for index, name in enumerate(["a-attachment.png", "a-result.json", "b-attachment.html"]):
+        (tmp_path / name).write_bytes(b"x")
+        os.utime(tmp_path / name, (1000 + index, 1000 + index))
+    assert prune_directory(str(tmp_path), max_files=1, max_bytes=1000, pattern=ALLURE_ATTACHMENT_GLOB) == 1
+    assert remaining(tmp_path) == ["a-result.json", "b-attachment.html"]
+
+
+def test_merged_worker_folders_respect_the_limits(tmp_path):
+    # every worker stayed within the limits on its own, together they are over them
+    for worker, offset in (("gw0", 0), ("gw1", 10)):
+        (tmp_path / worker).mkdir()
+        for index in range(3):
+            path = tmp_path / worker / f"failed_{worker}_{index}.png"
+            path.write_bytes(b"x" * 10)
+            os.utime(path, (1000 + offset + index, 1000 + offset + index))
+    writer = ArtifactWriter(str(tmp_path / "gw0"), max_files=4, max_bytes=35)
+    writer.close()
+
+    assert merge_worker_dirs(str(tmp_path)) == 6
+    assert writer.prune_merged(str(tmp_path)) == 3
+    # 35 bytes leave room for the three newest files, all of gw1
+    assert remaining(tmp_path) == ["failed_gw1_0.png", "failed_gw1_1.png", "failed_gw1_2.png"]
+
+
+def test_writer_stores_page_source_as_html(tmp_path):
+    writer = ArtifactWriter(str(tmp_path))
+    future = writer.submit("failed_test", None, "<html>é</html>")
+    assert writer.close() == []
+
+    (artifact,) = future.result()
+    assert (artifact["mime"], artifact["extension"]) == ("text/html", "html")
+    assert (tmp_path / "failed_test.html").read_text(encoding="utf-8") == "<html>é</html>"
+
+
+def test_writer_reports_failed_writes_at_close(tmp_path):
+    writer = ArtifactWriter(str(tmp_path / "missing"))
+    writer.submit("failed_test", None, "<html></html>")
+    (error,) = writer.close()
+    assert error.startswith("failed_test: ")
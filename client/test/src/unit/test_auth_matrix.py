@@ -0,0 +1,88 @@
+from src.auth_matrix import (
+    ALLOWED, ANONYMOUS, FORBIDDEN, UNAUTHENTICATED, Route, classify, expected_outcome, mismatches, parse_routes
+)
+
+ROUTES = '''
+import { Router } from "express";
+const router = Router();
+
+router.get("/", getAll);
+router.post("/", auth, checkUserType(["Municipality", "Organization"]), create);
+router.get(
+  "/:id",
+  auth,
+  (req, res) => handler(req, res, ["a, b", "(c)"]),
+);
+router.put("/search/(:term)", auth, validate({ fields: ["x,y"] }), update);
+router.delete('/:id', checkAuth, remove);
+'''
+
+
+def test_parse_routes():
+    routes = parse_routes(ROUTES, "/api/requests", "requestRoutes.ts")
+    assert [(route.method, route.path, route.auth, route.user_types) for route in routes] == [
+        ("GET", "/api/requests", False, None),
+        ("POST", "/api/requests", True, ("Municipality", "Organization")),
+        ("GET", "/api/requests/:id", True, None),
+        ("PUT", "/api/requests/search/(:term)", True, None),
+        # only the `auth` middleware counts
+        ("DELETE", "/api/requests/:id", False, None),
+    ]
+    assert [route.source for route in routes] == [f"requestRoutes.ts:{line}" for line in (5, 6, 7, 12, 13)]
+
+
+def test_parse_routes_strings_with_commas_and_parentheses():
+    source = r'''
+router.get("/search/:a,:b", auth, handler);
+router.post("/log", log("(", 'it\'s, ok'), auth, handler);
+router.put(`/t)`, log(")"), auth, handler);
+'''
+    routes = parse_routes(source, "/api")
+    assert [(route.path, route.auth) for route in routes] == [
+        ("/api/search/:a,:b", True), ("/api/log", True), ("/api/t)", True)
+    ]
+
+
+def test_parse_routes_nested_check_user_type():
+    source = 'router.patch("/x", auth, all([checkUserType(["Donor"]), limit({ max: 1 })]), handler);'
+    (route,) = parse_routes(source, "/api/x/")
+    assert route.path == "/api/x/x"
+    assert route.user_types == ("Donor",)
+
+
+def test_expected_outcome():
+    public = Route("GET", "/api/cities", False, None, "")
+    any_user = Route("GET", "/api/posts", True, None, "")
+    donors = Route("POST", "/api/donations", True, ("Donor",), "")
+
+    assert expected_outcome(public, ANONYMOUS) == ALLOWED
+    assert expected_outcome(any_user, ANONYMOUS) == UNAUTHENTICATED
+    assert expected_outcome(any_user, "soldier") == ALLOWED
+    assert expected_outcome(donors, "donor") == ALLOWED
+    assert expected_outcome(donors, "admin") == ALLOWED
+    assert expected_outcome(donors, "soldier") == FORBIDDEN
+
+
+def test_classify():
+    assert classify(401, {"error": "Invalid authentication token"}) == UNAUTHENTICATED
+    # a controller's own 401, e.g. wrong password, got past the middleware
+    assert classify(401, {"error": "Invalid credentials"}) == ALLOWED
+    assert classify(403, {"error": "Access denied. Only Donor users can access this route"}) == FORBIDDEN
+    assert classify(403, {"error": "Not the author"}) == ALLOWED
+    assert classify(429, {"error": "Too many requests"}) == ALLOWED
+    assert classify(401, "Unauthorized") == ALLOWED
+
+
+def test_mismatches():
+    route = Route("GET", "/api/posts", True, None, "postRoutes.ts:3")
+    results = [
+        {"route": route, "role": ANONYMOUS, "status": 200, "outcome": ALLOWED},
+        {"route": route, "role": "soldier", "status": 200, "outcome": ALLOWED},
+        {"route": route, "role": "donor", "status": None, "outcome": None, "error": "ConnectionError"},
+    ]
+    expected = {"GET /api/posts": {ANONYMOUS: UNAUTHENTICATED, "soldier": ALLOWED, "donor": ALLOWED}}
+
+    assert mismatches(results, expected) == [
+        "GET /api/posts as anonymous: expected unauthenticated, got allowed (HTTP 200, postRoutes.ts:3)",
+        "GET /api/posts as donor: expected allowed, got ConnectionError (HTTP None, postRoutes.ts:3)",
+    ]
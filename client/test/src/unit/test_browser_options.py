@@ -0,0 +1,21 @@
+import pytest
+
+from src.browser_options import build_chrome_options, parse_window_size
+
+
+@pytest.mark.parametrize("value", ["1920,1080", "1920x1080", "1920X1080"])
+def test_parse_window_size(value):
+    assert parse_window_size(value) == (1920, 1080)
+
+
+@pytest.mark.parametrize("value", ["1920", "1920,1080,1", "wide,tall", "0,1080", "", "-1x5"])
+def test_parse_window_size_rejects_malformed_values(value):
+    with pytest.raises(ValueError, match="--window-size"):
+        parse_window_size(value)
+
+
+def test_headless_options():
+    arguments = build_chrome_options(mode="headless", disable_images=True).arguments
+    assert "--headless=new" in arguments
+    assert "--blink-settings=imagesEnabled=false" in arguments
+    assert not any(argument.startswith("--window-size") for argument in arguments)
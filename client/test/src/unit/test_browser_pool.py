@@ -0,0 +1,74 @@
+import pytest
+
+from src.browser_pool import SITE_STORAGE_TYPES, BrowserPool, reset_browser, site_origin
+from src.config import CONFIG
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.calls.append(("switch", handle))
+
+
+class FakeDriver:
+    """Records what reset_browser() asks of the browser."""
+
+    def __init__(self, handles=("main",), fail_on=None):
+        self.window_handles = list(handles)
+        self.fail_on = fail_on
+        self.calls = []
+        self.switch_to = FakeSwitchTo(self)
+        self.quit_called = False
+
+    def close(self):
+        self.calls.append(("close",))
+
+    def execute_script(self, script):
+        self.calls.append(("script",))
+
+    def execute_cdp_cmd(self, command, params):
+        if command == self.fail_on:
+            raise RuntimeError(command)
+        self.calls.append((command, params))
+
+    def delete_all_cookies(self):
+        self.calls.append(("delete_all_cookies",))
+
+    def get(self, page_url):
+        self.calls.append(("get", page_url))
+
+    def quit(self):  # noqa: A003, the WebDriver method
+        self.quit_called = True
+
+
+def test_site_origin_drops_the_path():
+    assert site_origin("https://notalonesoldier.com/") == "https://notalonesoldier.com"
+    assert site_origin("http://127.0.0.1:8000/app") == "http://127.0.0.1:8000"
+
+
+def test_reset_clears_the_site_storage_before_leaving_the_page():
+    driver = FakeDriver(handles=("main", "popup"))
+    reset_browser(driver)
+
+    clear = ("Storage.clearDataForOrigin", {"origin": site_origin(CONFIG.base_url), "storageTypes": SITE_STORAGE_TYPES})
+    assert clear in driver.calls
+    assert driver.calls.index(clear) < driver.calls.index(("get", "about:blank"))
+    assert driver.calls[:3] == [("switch", "popup"), ("close",), ("switch", "main")]
+
+
+def test_reset_falls_back_to_webdriver_cookie_deletion():
+    driver = FakeDriver(fail_on="Network.clearBrowserCookies")
+    reset_browser(driver)
+    assert ("delete_all_cookies",) in driver.calls
+
+
+def test_pool_replaces_a_browser_that_fails_to_reset():
+    broken = FakeDriver(fail_on="Storage.clearDataForOrigin")
+    pool = BrowserPool(lambda: broken, size=1)
+
+    with pytest.raises(RuntimeError):
+        pool.release(pool.acquire())
+    assert broken.quit_called
+    assert pool.all == [] and pool.idle == []
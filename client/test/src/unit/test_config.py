@@ -0,0 +1,15 @@
+import pytest
+
+from src.config import CONFIG, url
+
+
+def test_url_joins_path_to_the_configured_site():
+    assert url("/profile") == f"{CONFIG.base_url}/profile"
+    assert url("profile") == f"{CONFIG.base_url}/profile"
+    assert url() == f"{CONFIG.base_url}/"
+
+
+@pytest.mark.parametrize("full_url", ["https://notalonesoldier.com/profile", "http://127.0.0.1:8000/"])
+def test_url_rejects_full_urls(full_url):
+    with pytest.raises(ValueError, match="full URL"):
+        url(full_url)
@@ -0,0 +1,39 @@
+from src.driver_resolver import DRIVER_FILE, find_cached_driver
+
+
+def pin(cache_dir, name):
+    """A cached chromedriver under the folder `name`, returns its path."""
+    folder = cache_dir / name
+    folder.mkdir()
+    (folder / DRIVER_FILE).write_text("")
+    return str(folder / DRIVER_FILE)
+
+
+def test_exact_version_wins(tmp_path):
+    exact = pin(tmp_path, "133.0.6943.98")
+    pin(tmp_path, "133.0.6943.141")
+    assert find_cached_driver("133.0.6943.98", str(tmp_path)) == exact
+
+
+def test_newest_build_of_the_same_major_version(tmp_path):
+    pin(tmp_path, "133.0.6943.9")
+    newest = pin(tmp_path, "133.0.6943.141")
+    pin(tmp_path, "134.0.6998.35")
+    assert find_cached_driver("133.0.7000.1", str(tmp_path)) == newest
+
+
+def test_no_matching_major_version(tmp_path):
+    pin(tmp_path, "132.0.6834.110")
+    assert find_cached_driver("133.0.6943.98", str(tmp_path)) is None
+    assert find_cached_driver("133.0.6943.98", str(tmp_path / "missing")) is None
+
+
+def test_junk_directories_are_skipped(tmp_path):
+    for name in ("latest", "133", "133.0.6943.141-partial", "133.0.6943.x"):
+        pin(tmp_path, name)
+    (tmp_path / "133.0.6943.200").mkdir()  # download never finished, no binary
+    (tmp_path / "notes.txt").write_text("")
+    assert find_cached_driver("133.0.6943.98", str(tmp_path)) is None
+
+    pinned = pin(tmp_path, "133.0.6943.50")
+    assert find_cached_driver("133.0.6943.98", str(tmp_path)) == pinned
@@ -0,0 +1,50 @@
+import pytest
+
+from src.durations import DEFAULT_SECONDS, load_durations, parse_shard, record_run, split_into_shards
+
+
+def run(run_id, started):
+    return {"run_id": run_id, "started": started, "base_url": "http://localhost", "browser": "headless",
+            "shard": None, "workers": 1, "platform": "linux", "python": "3.11"}
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    for value in ["2", "0/4", "5/4", "a/b"]:
+        with pytest.raises(ValueError, match="--shard"):
+            parse_shard(value)
+
+
+def test_split_balances_on_durations():
+    durations = {"a": 10, "b": 6, "c": 5, "d": 4, "e": 1}
+    shards = split_into_shards(list(durations), durations, 2)
+    assert shards == [["a", "d"], ["b", "c", "e"]]
+    assert [sum(durations[test] for test in shard) for shard in shards] == [14, 12]
+
+
+def test_split_counts_unknown_tests_as_the_median():
+    shards = split_into_shards(["known_long", "known_short", "new"], {"known_long": 9, "known_short": 1}, 2)
+    assert shards == [["known_long"], ["new", "known_short"]]
+
+
+def test_split_without_history_is_round_robin_by_name():
+    shards = split_into_shards(["c", "a", "d", "b"], {}, 2)
+    assert shards == [["a", "c"], ["b", "d"]]
+    assert DEFAULT_SECONDS > 0
+
+
+def test_split_is_the_same_whatever_the_collection_order():
+    durations = {"a": 3, "b": 3, "c": 3}
+    assert split_into_shards(["c", "b", "a"], durations, 3) == split_into_shards(["a", "b", "c"], durations, 3)
+
+
+def test_load_durations_uses_the_latest_runs_without_skips(tmp_path):
+    path = str(tmp_path / "durations.sqlite")
+    for index, seconds in enumerate([100, 2, 4, 6]):
+        record_run(run(f"run{index}", started=index), [
+            {"test": "t", "outcome": "passed", "seconds": seconds, "worker": "main"},
+            {"test": "skipped", "outcome": "skipped", "seconds": 0.0, "worker": "main"},
+        ], path)
+
+    assert load_durations(path, history=3) == {"t": 4}
+    assert load_durations(str(tmp_path / "missing.sqlite")) == {}
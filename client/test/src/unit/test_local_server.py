@@ -0,0 +1,43 @@
+import http.client
+
+import pytest
+
+from src.local_server import LocalServer
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("site")
+    public = tmp_path / "public"
+    public.mkdir()
+    (public / "index.html").write_text("index")
+    (public / "app.js").write_text("app")
+    (tmp_path / "public-old").mkdir()
+    (tmp_path / "public-old" / "secret.txt").write_text("secret")
+    (tmp_path / "secret.txt").write_text("secret")
+    server = LocalServer(public_dir=str(public)).start()
+    yield server
+    server.stop()
+
+
+def get(server, path):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    try:
+        connection.request("GET", path)
+        return connection.getresponse().read().decode()
+    finally:
+        connection.close()
+
+
+def test_serves_files_and_falls_back_to_index(server):
+    assert get(server, "/app.js") == "app"
+    assert get(server, "/login") == "index"
+
+
+@pytest.mark.parametrize("path", ["/../secret.txt", "/../public-old/secret.txt", "/%2e%2e/secret.txt"])
+def test_paths_outside_public_dir_get_index(server, path):
+    assert get(server, path) == "index"
+
+
+def test_mock_api_answers_json(server):
+    assert get(server, "/api/no-such-route").startswith("{")
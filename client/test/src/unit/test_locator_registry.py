@@ -0,0 +1,42 @@
+# Fast checks of the helpers themselves, no browser involved
+import textwrap
+
+from src import locator_registry
+from src.locator_registry import load_locators, get_locator, find_missing_references
+
+
+def test_load_locators_keys_every_page_by_name():
+    registry = load_locators()
+    assert registry is locator_registry.LOCATOR_REGISTRY
+    assert {page for page, _ in registry} >= {"landing", "login", "signup", "profile"}
+    assert get_locator("landing", "button_login_page") == "//button[normalize-space()='Login']"
+
+
+def test_get_locator_unknown_name_is_none():
+    load_locators()
+    assert get_locator("landing", "no_such_element") is None
+    assert get_locator("no_such_page", "button_login_page") is None
+
+
+def test_get_locator_loads_registry_lazily():
+    locator_registry.LOCATOR_REGISTRY.clear()
+    assert get_locator("landing", "button_login_page") is not None
+
+
+def test_find_missing_references_reports_unknown_literal_names(tmp_path):
+    load_locators()
+    test_file = tmp_path / "test_example.py"
+    test_file.write_text(textwrap.dedent("""
+        def test_example(driver, name):
+            wait_for_element(driver, "landing", "button_login_page")
+            wait_until_visible(driver, page="landing", element_name="button_missing")
+            validate_input(driver, "login", "input_missing", "error_missing")
+            wait_for_element(driver, "landing", name)
+    """), encoding="utf-8")
+
+    missing = find_missing_references([str(test_file)])
+
+    assert [line.split(" ", 1)[1] for line in missing] == [
+        "landing/button_missing", "login/input_missing", "login/error_missing"
+    ]
+    assert missing[0].split(" ")[0].endswith("test_example.py:4")
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from src.parallel import (
+    MAIN_WORKER, get_worker_id, is_worker, merge_worker_dirs, merge_worker_files, worker_file
+)
+
+CONTROLLER = SimpleNamespace()
+WORKER = SimpleNamespace(workerinput={"workerid": "gw1"})
+
+
+def test_worker_id():
+    assert get_worker_id(CONTROLLER) == MAIN_WORKER
+    assert get_worker_id(WORKER) == "gw1"
+    assert not is_worker(CONTROLLER)
+    assert is_worker(WORKER)
+
+
+def test_merge_worker_files_appends_and_removes_parts(tmp_path):
+    path = tmp_path / "timings.jsonl"
+    path.write_text("main\n")
+    (tmp_path / "timings.jsonl.gw1").write_text("gw1\n")
+    (tmp_path / "timings.jsonl.gw0").write_text("gw0\n")
+
+    merge_worker_files(str(path))
+
+    assert path.read_text() == "main\ngw0\ngw1\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["timings.jsonl"]
+
+
+def test_worker_file_of_worker_is_its_own_part(tmp_path):
+    path = str(tmp_path / "timings.jsonl")
+    assert worker_file(path, WORKER) == f"{path}.gw1"
+
+
+def test_worker_file_of_controller_truncates_and_clears_stale_parts(tmp_path):
+    path = tmp_path / "timings.jsonl"
+    path.write_text("previous run\n")
+    (tmp_path / "timings.jsonl.gw3").write_text("crashed run\n")
+
+    assert worker_file(str(path), CONTROLLER) == str(path)
+    (tmp_path / "timings.jsonl.gw0").write_text("this run\n")
+    merge_worker_files(str(path))
+
+    assert path.read_text() == "this run\n"
+
+
+def test_merge_worker_dirs_moves_files_up(tmp_path):
+    (tmp_path / "gw0").mkdir()
+    (tmp_path / "gw1").mkdir()
+    (tmp_path / "gw0" / "a.png").write_text("a")
+    (tmp_path / "gw1" / "a.png").write_text("b")
+    (tmp_path / "other").mkdir()
+
+    assert merge_worker_dirs(str(tmp_path)) == 2
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.png", "gw1_a.png", "other"]
@@ -0,0 +1,110 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src import perf_budget
+from src.perf_budget import PerfBudgetError, check, failed, load_budgets, page_budgets
+
+
+@pytest.fixture
+def pages(tmp_path, monkeypatch):
+    """Builds a pages dir whose <page>/budgets.py declares the given BUDGETS lists."""
+    modules = {}
+
+    def build(**budgets_by_page):
+        for page, budgets in budgets_by_page.items():
+            (tmp_path / page).mkdir()
+            (tmp_path / page / "budgets.py").write_text("")
+            modules[f"src.pages.{page}.budgets"] = SimpleNamespace(BUDGETS=budgets)
+        return str(tmp_path)
+
+    monkeypatch.setattr(perf_budget.importlib, "import_module", modules.__getitem__)
+    monkeypatch.setattr(perf_budget, "BUDGET_REGISTRY", {})
+    return build
+
+
+@contextmanager
+def own_recording(active=True):
+    """
+    Records the checks of the block apart from the suite's own recording of
+    this test, which would otherwise fail it for the exceeded budgets.
+    """
+    saved = perf_budget._current_results
+    perf_budget.start_recording()
+    if not active:
+        perf_budget.stop_recording()
+    try:
+        yield
+    finally:
+        perf_budget._current_results = saved
+
+
+def test_load_budgets_of_the_real_pages():
+    registry = load_budgets()
+    assert registry[("landing", "lcp_landing")]["unit"] == "ms"
+    assert registry[("landing", "cls_landing")]["severity"] == "warn"
+    assert [budget["name"] for budget in page_budgets("https://example.com/login")] == ["lcp_login"]
+
+
+def test_load_budgets_fills_defaults(pages):
+    registry = load_budgets(pages(home=[
+        {"name": "lcp", "path": "/", "metric": "largestContentfulPaint", "max_ms": 2500},
+        {"name": "cls", "path": "/", "metric": "cumulativeLayoutShift", "max": 0.1, "severity": "warn"},
+    ]))
+    assert registry[("home", "lcp")] == {
+        "name": "lcp", "path": "/", "metric": "largestContentfulPaint", "max_ms": 2500,
+        "page": "home", "limit": 2500, "unit": "ms", "severity": "fail",
+    }
+    assert registry[("home", "cls")]["unit"] == ""
+
+
+def test_load_budgets_reports_every_invalid_entry(pages):
+    with pytest.raises(PerfBudgetError) as error:
+        load_budgets(pages(home=[
+            {"name": "no_limit"},
+            {"name": "bad_severity", "max_ms": 1, "severity": "panic"},
+            {"name": "path_only", "path": "/", "max_ms": 1},
+            {"name": "twice", "max_ms": 1},
+            {"name": "twice", "max_ms": 2},
+        ]))
+    assert str(error.value).splitlines() == [
+        "home/budgets.py entry #0 is missing a name or max_ms/max",
+        "home/budgets.py 'bad_severity' has an unknown severity",
+        "home/budgets.py 'path_only' needs both a path and a metric, or neither",
+        "home/budgets.py declares 'twice' more than once",
+    ]
+
+
+def test_check_records_without_raising(pages):
+    registry = load_budgets(pages(home=[{"name": "open", "max_ms": 100}]))
+    budget = registry[("home", "open")]
+
+    with own_recording():
+        assert check(budget, 50)["passed"]
+        result = check(budget, 150)
+        results = perf_budget.recorded()
+
+    assert not result["passed"]
+    assert [result["value"] for result in results] == [50, 150]
+    assert failed(results) == [result]
+
+
+def test_warn_mode_and_warn_budgets_never_fail(pages):
+    registry = load_budgets(pages(home=[
+        {"name": "open", "max_ms": 100},
+        {"name": "soft", "max_ms": 100, "severity": "warn"},
+    ]))
+
+    with own_recording():
+        results = [check(registry[("home", "open")], 150, mode="warn"), check(registry[("home", "soft")], 150)]
+
+    assert [result["severity"] for result in results] == ["warn", "warn"]
+    assert failed(results) == []
+
+
+def test_checks_outside_a_test_are_not_recorded(pages):
+    registry = load_budgets(pages(home=[{"name": "open", "max_ms": 100}]))
+    with own_recording(active=False):
+        check(registry[("home", "open")], 150)
+        assert perf_budget.recorded() == []
@@ -0,0 +1,68 @@
+import pytest
+import requests
+
+from src import server_process
+from src.server_process import ALREADY_REGISTERED, seed_accounts
+
+
+class FakeResponse:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self.data = data
+        self.text = str(data)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self.data
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """
+    Fake register/login/approve endpoints. The test sets the answer of the
+    register call, logins of unknown emails are pending until approved.
+    """
+    state = {"register": FakeResponse(201, {}), "approved": set(), "approvals": 0}
+
+    def post(url, json=None, headers=None):
+        if url.endswith("/auth/register"):
+            return state["register"]
+        if url.endswith("/auth/login"):
+            user = {"_id": json["email"]}
+            if json["email"] not in state["approved"]:
+                return FakeResponse(200, {"user": user, "status": "pending"})
+            return FakeResponse(200, {"user": user, "token": f"token-{json['email']}"})
+        state["approvals"] += 1
+        state["approved"].add(url.rsplit("/", 1)[1])
+        return FakeResponse(200, {})
+
+    monkeypatch.setattr(server_process.SESSION, "post", post)
+    monkeypatch.setattr(server_process, "get_token", lambda role: "admin-token")
+    return state
+
+
+def test_new_accounts_are_approved_and_logged_in(api):
+    accounts = seed_accounts(2, workers=1)
+    assert accounts == [
+        {"_id": "load-soldier-0@not-alone.test", "token": "token-load-soldier-0@not-alone.test"},
+        {"_id": "load-soldier-1@not-alone.test", "token": "token-load-soldier-1@not-alone.test"},
+    ]
+    assert api["approvals"] == 2
+
+
+def test_already_registered_accounts_are_reused(api):
+    api["register"] = FakeResponse(400, {"error": ALREADY_REGISTERED})
+    api["approved"].add("load-soldier-0@not-alone.test")
+
+    assert seed_accounts(1, workers=1)[0]["token"] == "token-load-soldier-0@not-alone.test"
+    assert api["approvals"] == 0
+
+
+def test_invalid_profile_fails_at_registration(api):
+    api["register"] = FakeResponse(400, {"errors": [{"path": "phone", "msg": "Invalid phone format"}]})
+
+    with pytest.raises(requests.HTTPError, match="Invalid phone format"):
+        seed_accounts(1, workers=1)
@@ -0,0 +1,70 @@
+import pytest
+
+from src.start_state import StartState, get_start_state, matches, schedule
+
+
+class FakeItem:
+    def __init__(self, name, *args, **kwargs):
+        self.name = name
+        self.marker = pytest.mark.start_state(*args, **kwargs).mark if args else None
+
+    def get_closest_marker(self, name):
+        return self.marker if name == "start_state" else None
+
+
+class FakeDriver:
+    def __init__(self, page=None, error=None):
+        self.page = page
+        self.error = error
+
+    def execute_script(self, script, *args):
+        if self.error:
+            raise self.error
+        return self.page
+
+
+def test_get_start_state():
+    assert get_start_state(FakeItem("a")) is None
+    assert get_start_state(FakeItem("b", "/profile", role="soldier")) == StartState("/profile", "soldier")
+
+
+def test_schedule_groups_equal_states_where_the_first_one_was():
+    items = [
+        FakeItem("landing_1", "/"),
+        FakeItem("no_state_1"),
+        FakeItem("login_1", "/login"),
+        FakeItem("landing_2", "/"),
+        FakeItem("dialog_1", "/", dialog="donate"),
+        FakeItem("no_state_2"),
+        FakeItem("login_2", "/login"),
+        FakeItem("landing_3", "/"),
+    ]
+    assert [item.name for item in schedule(items)] == [
+        "landing_1", "landing_2", "landing_3", "no_state_1", "login_1", "login_2", "dialog_1", "no_state_2"
+    ]
+
+
+def page(state, **overrides):
+    return {"key": state.key, "path": state.path, "loggedIn": state.role is not None,
+            "dialogOpen": state.dialog is not None, "pristine": True, **overrides}
+
+
+def test_matches_the_untouched_page_of_the_state():
+    state = StartState("/profile", role="soldier")
+    assert matches(FakeDriver(page(state)), state)
+
+
+@pytest.mark.parametrize("overrides", [
+    {"key": None},
+    {"path": "/login"},
+    {"loggedIn": False},
+    {"dialogOpen": True},
+    {"pristine": False},
+])
+def test_does_not_match_a_changed_page(overrides):
+    state = StartState("/profile", role="soldier")
+    assert not matches(FakeDriver(page(state, **overrides)), state)
+
+
+def test_does_not_match_when_the_page_cannot_be_read():
+    assert not matches(FakeDriver(error=RuntimeError("no such window")), StartState("/"))
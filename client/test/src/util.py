@@ -1,6 +1,4 @@
-import importlib
-from time import sleep
-import requests
+import json
 
 import allure
 from selenium.webdriver.common.by import By
@@ -8,25 +6,148 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from typing import Dict, List, Tuple, Optional
-import allure
-from typing import List, Tuple
 from selenium.webdriver.support.ui import Select
 
 # important do not delete
-from src.pages.landing.locators import LOCATORS
+from src.pages.landing.locators import LOCATORS  # noqa: F401
+from src.locator_registry import get_locator
+from src.api_client import SESSION, api_login, api_url, auth_headers, get_token
+from src.timings import timed, timing
+
+# Upper bound for waiting on a scroll to settle, the old fixed sleep was 200 ms
+SCROLL_SETTLE_CAP_MS = 200
+
+# Scrolls arguments[0] to the center and calls back once its position has not
+# changed for one animation frame while it is inside the viewport (or for three
+# frames if it can't fit), or when the cap is reached
+SCROLL_SETTLE_SCRIPT = """
+const element = arguments[0], capMs = arguments[1], done = arguments[arguments.length - 1];
+element.scrollIntoView({block: 'center', inline: 'center'});
+const start = performance.now();
+let last = element.getBoundingClientRect(), stableFrames = 0, finished = false;
+function finish() {
+    if (!finished) { finished = true; done(performance.now() - start); }
+}
+function inViewport(rect) {
+    return rect.top >= 0 && rect.left >= 0 && rect.bottom <= window.innerHeight && rect.right <= window.innerWidth;
+}
+function check() {
+    if (finished) return;
+    const rect = element.getBoundingClientRect();
+    stableFrames = (rect.top === last.top && rect.left === last.left) ? stableFrames + 1 : 0;
+    last = rect;
+    if ((stableFrames >= 1 && inViewport(rect)) || stableFrames >= 3 || performance.now() - start >= capMs) {
+        return finish();
+    }
+    requestAnimationFrame(check);
+}
+// requestAnimationFrame doesn't run in hidden tabs, the timeout keeps the cap
+setTimeout(finish, capMs);
+requestAnimationFrame(check);
+"""
 
 
+@timed
 @allure.step("skip disclaimer")
 def pass_disclaimer(driver):
     wait_for_element(driver, "landing", "Button_disclaimer_just_looking_around").click()
 
 
+# The disclaimer keeps no flag in storage (it opens whenever the landing page
+# mounts), so instead of seeding one this clicks its button from inside the
+# page as soon as React inserts it. arguments: the button's xpath.
+DISCLAIMER_BYPASS_SCRIPT = """
+(() => {
+    const xpath = %s;
+    const dismiss = () => {
+        const button = document.evaluate(
+            xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (button && button.closest('[role="dialog"]')) {
+            button.click();
+            window.__disclaimerDismissed = true;
+        }
+    };
+    new MutationObserver((mutations) => {
+        const addedButton = mutations.some((mutation) => Array.from(mutation.addedNodes).some(
+            (node) => node.nodeType === 1 && (node.matches('button') || node.querySelector('button'))));
+        if (addedButton) dismiss();
+    }).observe(document, {childList: true, subtree: true});
+})();
+"""
+
+
+def install_disclaimer_bypass(driver):
+    """Dismisses the landing disclaimer on every page load of `driver` from now on."""
+    source = DISCLAIMER_BYPASS_SCRIPT % json.dumps(get_locator("landing", "Button_disclaimer_just_looking_around"))
+    driver.disclaimer_bypass = driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument", {"source": source}
+    )["identifier"]
+
+
+def remove_disclaimer_bypass(driver):
+    if getattr(driver, "disclaimer_bypass", None):
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": driver.disclaimer_bypass})
+        driver.disclaimer_bypass = None
+
+
+# True once the disclaimer is in the page or the bypass has already clicked it away
+DISCLAIMER_SHOWN_SCRIPT = """
+return !!window.__disclaimerDismissed || !!document.evaluate(
+    arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+"""
+
+
+@timed
+def wait_for_disclaimer(driver, timeout=5, appear_timeout=2):
+    """
+    Gets past the landing disclaimer: waits for the bypass to have closed it,
+    or clicks it away when the browser has no bypass installed.
+    """
+    if not getattr(driver, "disclaimer_bypass", None):
+        pass_disclaimer(driver)
+        return
+    xpath = get_locator("landing", "Button_disclaimer_just_looking_around")
+    # The button is also invisible before React has rendered the dialog, so wait for it to
+    # have shown up first. The flag covers a dialog dismissed between two polls.
+    try:
+        WebDriverWait(driver, appear_timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script(DISCLAIMER_SHOWN_SCRIPT, xpath)
+        )
+    except TimeoutException:
+        print("Warning: the landing disclaimer did not show up")
+        return
+    WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+        EC.invisibility_of_element_located((By.XPATH, xpath))
+    )
+
+
+@timed
+@allure.step("fill profile form")
+def fill_profile_form(driver, nickname, phone, bio):
+    for element_name, value in (("input_nickname", nickname), ("input_phone", phone), ("textarea_bio", bio)):
+        field = wait_for_element(driver, "profile", element_name)
+        assert field is not None, f"❌ {element_name} not found"
+        field.clear()
+        field.send_keys(value)
+
+
+@timed
+@allure.step("save profile")
+def save_profile(driver):
+    save_button = wait_for_element(driver, "profile", "button_save_changes")
+    assert save_button is not None, "❌ Save Changes button not found"
+    driver.execute_script("arguments[0].click();", save_button)
+    return accept_alert(driver)
+
+
+@timed
 @allure.step("Check if {element_name} exists")
 def wait_for_element(driver, page, element_name, timeout=2):
     """
-    Dynamically imports the locators from pages/<page>/locators.py,
-    finds the specified element by name, and waits up to `timeout` seconds
-    for it to be visible on the page. If found, scrolls to the element.
+    Looks up the xpath for (page, element_name) in the locator registry,
+    which is built once per session from every pages/<page>/locators.py,
+    and waits up to `timeout` seconds for it to be visible on the page.
+    If found, scrolls to the element.
     Returns the element if found, otherwise None.
 
     :param driver:       Selenium WebDriver instance.
@@ -37,44 +158,59 @@ def wait_for_element(driver, page, element_name, timeout=2):
                          otherwise None.
     """
     try:
-        # Dynamically import the locators module for the given page
-        locators_module = importlib.import_module(f"src.pages.{page}.locators")
-        # Get the LOCATORS list from that module
-        locators = getattr(locators_module, "LOCATORS", [])
-
-        # Find the matching locator by name
-        path = None
-        for locator in locators:
-            if locator.get("name") == element_name:
-                path = locator.get("xpath")
-                break
-        print(path)
+        path = get_locator(page, element_name)
         # If no matching locator was found, return None immediately
         if not path:
             return None
 
         # Wait until the element is visible
-        element = WebDriverWait(driver, timeout).until(
-            EC.visibility_of_element_located((By.XPATH, path))
-        )
+        with timing("wait_for_element.wait"):
+            element = WebDriverWait(driver, timeout).until(
+                EC.visibility_of_element_located((By.XPATH, path))
+            )
 
         assert element, "❌ failed to find element"
-        
-        # Scroll the element into view with instant behavior
+
+        # Scroll the element into view and return as soon as it has settled
         try:
-            driver.execute_script(
-                "arguments[0].scrollIntoView({block: 'center', inline: 'center'});",
-                element
-            )
-            sleep(0.2)
+            with timing("wait_for_element.scroll"):
+                driver.execute_async_script(SCROLL_SETTLE_SCRIPT, element, SCROLL_SETTLE_CAP_MS)
         except Exception as e:
             print(f"Warning: Could not scroll to element {element_name}: {str(e)}")
-            
+
         return element
     except TimeoutException:
         return None
 
 
+@timed
+@allure.step("Check {element_name} links to {expected_url}")
+def assert_link_href(driver, page, element_name, expected_url):
+    """
+    Checks where a link points without clicking it, so external links
+    (e.g. GitHub profiles) are verified without leaving the site.
+    """
+    element = wait_for_element(driver, page, element_name)
+    assert element is not None, f"❌ {element_name} not found"
+    href = element.get_attribute("href")
+    assert href == expected_url, f"❌ {element_name} links to {href}, expected {expected_url}"
+
+
+@allure.step("Wait until {element_name} is visible")
+def wait_until_visible(driver, page, element_name, timeout=5):
+    """
+    Like wait_for_element but polls every 50 ms and doesn't scroll, for
+    timing how fast something appears (see the budget fixture).
+    Returns the element if visible within `timeout`, otherwise None.
+    """
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+            EC.visibility_of_element_located((By.XPATH, get_locator(page, element_name)))
+        )
+    except TimeoutException:
+        return None
+
+
 # Test cases for different validation modes
 VALIDATION_TEST_CASES: Dict[str, List[Tuple[str, Optional[str]]]] = {
     "name": [
@@ -160,12 +296,14 @@ VALIDATION_TEST_CASES: Dict[str, List[Tuple[str, Optional[str]]]] = {
         ("AB123456", None),  # Valid
         ("123456789", None),  # Valid
     ],
-   
+
 }
 
 
+@timed
 @allure.step("Test validation for {input_element}")
-def validate_input(driver, page: str, input_element: str, error_element: str, mode: str) -> List[Tuple[bool, str]]:
+def validate_input(driver, page: str, input_element: str, error_element: str, mode: str,
+                   batched: bool = True) -> List[Tuple[bool, str]]:
     """
     Validates an input field using predefined test cases based on the validation mode.
     Handles both text inputs and select elements.
@@ -175,15 +313,20 @@ def validate_input(driver, page: str, input_element: str, error_element: str, mo
     :param input_element: The name of the input element in locators
     :param error_element: The name of the error message element in locators
     :param mode: Validation mode (e.g., 'email', 'phone', 'cardNumber', etc.)
+    :param batched: Run all cases in one in-browser script (fast). Pass False to
+                    type every value through WebDriver like a user would.
     :return: List of (success, error_message) tuples for each test case
     """
     if mode not in VALIDATION_TEST_CASES:
         return [(False, f"Unknown validation mode: {mode}")]
 
+    if batched:
+        return _validate_input_batched(driver, page, input_element, error_element, mode)
+
     results = []
 
     for test_value, expected_error in VALIDATION_TEST_CASES[mode]:
-        with allure.step(f"Validating input '{test_value}' for mode '{mode}'"):
+        with allure.step(f"Validating input '{test_value}' for mode '{mode}'"), timing("validate_input.case"):
             # Find and verify input field
             input_field = wait_for_element(driver, page, input_element)
             if not input_field:
@@ -224,8 +367,8 @@ def validate_input(driver, page: str, input_element: str, error_element: str, mo
 
                     with allure.step(f"Comparing expected '{expected_error}' with actual '{actual_error}'"):
                         if actual_error != expected_error:
-                            results.append((False,
-                                            f"Input: {test_value}, Expected error: '{expected_error}' but got: '{actual_error}'"))
+                            results.append((False, f"Input: {test_value}, Expected error: '{expected_error}' "
+                                                   f"but got: '{actual_error}'"))
                             continue
                 else:
                     # For valid inputs, verify no error message is shown
@@ -239,31 +382,156 @@ def validate_input(driver, page: str, input_element: str, error_element: str, mo
     return results
 
 
-def get_admin_login_token():
-    # Prepare the login payload
-    payload = {
-        "email": "shalev396@admin.com",
-        "password": "12345678a"
+# Runs every (value, expected_error) case for one field inside the browser.
+# Values are set through the native prototype setter so React's onChange sees
+# them, then input/change and blur events are fired and the error node is
+# polled until it shows the expected state or the per-case timeout runs out.
+VALIDATE_INPUT_BATCH_SCRIPT = """
+const [inputXpath, errorXpath, cases, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const byXpath = (xpath) => document.evaluate(
+    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const nextFrame = () => new Promise((resolve) => requestAnimationFrame(() => resolve()));
+const readError = () => {
+    const node = byXpath(errorXpath);
+    const visible = !!node && node.getClientRects().length > 0
+        && getComputedStyle(node).visibility !== 'hidden';
+    return {found: !!node, visible: visible, text: node ? node.innerText.trim() : null};
+};
+(async () => {
+    const results = [];
+    for (const [value, expected] of cases) {
+        const input = byXpath(inputXpath);
+        if (!input) {
+            results.push({value: value, interactError: 'input field not found'});
+            continue;
+        }
+        const tag = input.tagName.toLowerCase();
+        if (tag === 'select' && ![...input.options].some((option) => option.value === value)) {
+            results.push({value: value, interactError: `no option with value '${value}'`});
+            continue;
+        }
+        const proto = tag === 'select' ? HTMLSelectElement.prototype
+            : tag === 'textarea' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        const setValue = Object.getOwnPropertyDescriptor(proto, 'value').set;
+        input.focus();
+        setValue.call(input, value);
+        input.dispatchEvent(new Event('input', {bubbles: true}));
+        input.dispatchEvent(new Event('change', {bubbles: true}));
+        // blur() on the focused input fires the native blur and focusout events, like a user tabbing away
+        input.blur();
+
+        // Give React at least two frames to re-render before trusting the error node
+        await nextFrame();
+        await nextFrame();
+        const start = performance.now();
+        let error = readError();
+        while (performance.now() - start < timeoutMs) {
+            const settled = expected ? (error.visible && error.text === expected) : !error.visible;
+            if (settled) break;
+            await nextFrame();
+            error = readError();
+        }
+        results.push({value: value, found: error.found, visible: error.visible, text: error.text});
     }
+    done(results);
+})().catch((e) => done([{value: null, interactError: String(e)}]));
+"""
 
-    # Send a POST request to the login endpoint
-    url = "https://notalonesoldier.com/api/auth/login"
-    response = requests.post(url, json=payload)
-    # Raise an exception if the request returned an error status
-    response.raise_for_status()
-    # Parse the response JSON
-    data = response.json()
-    # Extract the 'token' field from the response
-    # Assuming the returned JSON looks like:
-    # {
-    #   "token": "...",
-    #   "user": { ... }
-    # }
-    token = data["token"]
-    # Return the token
-    return token
+
+def _validate_input_batched(driver, page: str, input_element: str, error_element: str,
+                            mode: str, timeout: float = 2) -> List[Tuple[bool, str]]:
+    """
+    Batched variant of validate_input: one WebDriver round-trip for all of
+    the mode's cases instead of several per case. Returns the same
+    (success, error_message) tuples and messages as the WebDriver path.
+    """
+    cases = VALIDATION_TEST_CASES[mode]
+
+    input_field = wait_for_element(driver, page, input_element)
+    if not input_field:
+        return [(False, f"Input field not found for test value: {test_value}") for test_value, _ in cases]
+
+    with timing("validate_input.batch"):
+        outcomes = driver.execute_async_script(
+            VALIDATE_INPUT_BATCH_SCRIPT,
+            get_locator(page, input_element),
+            get_locator(page, error_element),
+            [list(case) for case in cases],
+            timeout * 1000
+        )
+    if len(outcomes) != len(cases):
+        return [(False, f"Batched validation script failed: {outcomes}")]
+
+    results = []
+    for (test_value, expected_error), outcome in zip(cases, outcomes):
+        with allure.step(f"Validating input '{test_value}' for mode '{mode}'"):
+            if outcome.get("interactError"):
+                results.append((False, f"Failed to interact with input for {test_value}: {outcome['interactError']}"))
+                continue
+
+            actual_error = outcome["text"]
+            if expected_error:
+                if not outcome["visible"]:
+                    results.append((False, f"Error message element not found for test value: {test_value}"))
+                    continue
+                with allure.step(f"Comparing expected '{expected_error}' with actual '{actual_error}'"):
+                    if actual_error != expected_error:
+                        results.append((False, f"Input: {test_value}, Expected error: '{expected_error}' "
+                                               f"but got: '{actual_error}'"))
+                        continue
+            elif outcome["visible"]:
+                results.append((False, f"Unexpected error message for valid input {test_value}: {actual_error}"))
+                continue
+
+            results.append((True, None))
+
+    return results
+
+
+def get_admin_login_token():
+    return get_token("admin")
+
+
+# Writes the login state into sessionStorage before any app script runs,
+# the same keys login-form.tsx sets after a successful login
+SESSION_INJECTION_SCRIPT = """
+if (window.location.origin === %(origin)s) {
+    sessionStorage.setItem("token", %(token)s);
+    sessionStorage.setItem("id", %(id)s);
+    sessionStorage.setItem("user", %(user)s);
+}
+"""
 
 
+@timed
+@allure.step("Open {url} logged in as {role}")
+def open_authenticated_page(driver, role: str, url: str):
+    """
+    Opens `url` already logged in as `role`, skipping the UI login flow.
+    The cached API token and user are injected into sessionStorage on the
+    first document load only, so later logouts behave normally.
+
+    :param driver: Selenium WebDriver instance (Chrome).
+    :param role:   Key in TEST_USERS.
+    :param url:    Page to land on, e.g. url('/profile').
+    """
+    data = api_login(role)
+    origin = "/".join(url.split("/")[:3])
+    source = SESSION_INJECTION_SCRIPT % {
+        "origin": json.dumps(origin),
+        "token": json.dumps(data["token"]),
+        "id": json.dumps(data["user"]["_id"]),
+        "user": json.dumps(json.dumps(data["user"])),
+    }
+    script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+    try:
+        driver.get(url)
+    finally:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+
+
+@timed
 def delete_user(token, user_id):
     """
     Sends a DELETE request to delete a user by user_id.
@@ -276,15 +544,10 @@ def delete_user(token, user_id):
         dict: The JSON response from the server (if any).
     """
 
-    url = f"https://notalonesoldier.com/api/users/{user_id}"
+    url = api_url(f"/users/{user_id}")
 
-    # If your API literally expects "Burner <token>" in the header,
-    # change 'Bearer' to 'Burner'.
-    headers = {
-        "Authorization": f"Bearer {token}"
-    }
-
-    response = requests.delete(url, headers=headers)
+    # Goes through the shared keep-alive session instead of a new connection per call
+    response = SESSION.delete(url, headers=auth_headers(token))
 
     # Raise an exception if an error (4xx or 5xx) occurs
     response.raise_for_status()
@@ -292,6 +555,9 @@ def delete_user(token, user_id):
     # Return whatever JSON the endpoint might provide upon deletion
     # If there's no body, this line may cause an error; handle as needed.
     return response.json()
+
+
+@timed
 def get_session_storage_value(driver, key):
     """
     Retrieves the value for a given key from the browser's sessionStorage.
@@ -302,3 +568,21 @@ def get_session_storage_value(driver, key):
     """
     value = driver.execute_script("return sessionStorage.getItem(arguments[0]);", key)
     return value
+
+
+@timed
+def accept_alert(driver, timeout=3):
+    """
+    Waits for a JavaScript alert, accepts it and returns its text.
+
+    :param driver:  WebDriver instance
+    :param timeout: How long to wait for the alert (in seconds)
+    :return: The alert text, or None if no alert appeared
+    """
+    try:
+        alert = WebDriverWait(driver, timeout).until(EC.alert_is_present())
+    except TimeoutException:
+        return None
+    text = alert.text
+    alert.accept()
+    return text